@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strconv"
 	"strings"
 	"sync"
@@ -126,6 +127,17 @@ func confBool(key string) bool {
 	return intutil.Truthy(confString(key))
 }
 
+// confBoolDefault is confBool with a fallback for keys missing from the file;
+// an existing app.conf replaces app.conf.default entirely, so keys added later
+// are absent there.
+func confBoolDefault(key string, def bool) bool {
+	v := confString(key)
+	if v == "" {
+		return def
+	}
+	return intutil.Truthy(v)
+}
+
 func confList(key string) []string {
 	if err := ensureConfigLoaded(); err != nil {
 		return nil
@@ -197,7 +209,55 @@ func initRuntimeConfig() error {
 	if jobTimeoutSec <= 0 {
 		return fmt.Errorf("JOB_TIMEOUT_SEC must be > 0 (source: %s)", configPath)
 	}
-	splitTaskQueues = confBool("SPLIT_TRANSCRIBE_REFINE_QUEUE")
+	splitTaskQueues = confBoolDefault("SPLIT_TRANSCRIBE_REFINE_QUEUE", true)
+
+	whisperModelFile = strings.TrimSpace(confString("WHISPER_MODEL_FILE"))
+	if whisperModelFile == "" {
+		whisperModelFile = "ggml-model.bin"
+	}
+	if filepath.Base(whisperModelFile) != whisperModelFile {
+		return fmt.Errorf("WHISPER_MODEL_FILE must be a file name under whisper/models (source: %s)", configPath)
+	}
+
+	whisperWorkers = confInt("WHISPER_WORKERS")
+	if whisperWorkers < 0 {
+		return fmt.Errorf("WHISPER_WORKERS must be >= 0 (source: %s)", configPath)
+	}
+	if whisperWorkers == 0 {
+		whisperWorkers = 1
+	}
+
+	whisperThreads = confInt("WHISPER_THREADS")
+	if whisperThreads < 0 {
+		return fmt.Errorf("WHISPER_THREADS must be >= 0 (source: %s)", configPath)
+	}
+	if whisperThreads == 0 {
+		whisperThreads = max(1, runtime.NumCPU()/whisperWorkers)
+	}
+	whisperFlashAttn = confBoolDefault("WHISPER_FLASH_ATTN", true)
+
+	whisperProcessors = confInt("WHISPER_PROCESSORS")
+	if whisperProcessors < 0 {
+		return fmt.Errorf("WHISPER_PROCESSORS must be >= 0 (source: %s)", configPath)
+	}
+
+	whisperBeamSize = confInt("WHISPER_BEAM_SIZE")
+	if whisperBeamSize < 0 {
+		return fmt.Errorf("WHISPER_BEAM_SIZE must be >= 0 (source: %s)", configPath)
+	}
+	whisperBestOf = confInt("WHISPER_BEST_OF")
+	if whisperBestOf < 0 {
+		return fmt.Errorf("WHISPER_BEST_OF must be >= 0 (source: %s)", configPath)
+	}
+	whisperNoFallback = confBool("WHISPER_NO_FALLBACK")
+
+	refineWorkers = confInt("REFINE_WORKERS")
+	if refineWorkers < 0 {
+		return fmt.Errorf("REFINE_WORKERS must be >= 0 (source: %s)", configPath)
+	}
+	if refineWorkers == 0 {
+		refineWorkers = max(1, len(geminiAPIKeysFromConfig()))
+	}
 
 	geminiModel = strings.TrimSpace(confString("GEMINI_MODEL"))
 	if geminiModel == "" {
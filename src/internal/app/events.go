@@ -46,6 +46,14 @@ func (b *userEventBroker) Notify(userID, eventType string, payload map[string]an
 	if userID == "" {
 		return
 	}
+	// Most updates (e.g. progress ticks) happen with nobody listening, so skip
+	// the JSON encoding entirely in that case.
+	b.mu.RLock()
+	listening := len(b.subscribers[userID]) > 0
+	b.mu.RUnlock()
+	if !listening {
+		return
+	}
 	body := map[string]any{
 		"type": eventType,
 		"at":   time.Now().Format(time.RFC3339Nano),
@@ -57,7 +65,10 @@ func (b *userEventBroker) Notify(userID, eventType string, payload map[string]an
 	if err != nil {
 		return
 	}
-	message := []byte(fmt.Sprintf("event: update\ndata: %s\n\n", data))
+	message := make([]byte, 0, len(data)+len("event: update\ndata: \n\n"))
+	message = append(message, "event: update\ndata: "...)
+	message = append(message, data...)
+	message = append(message, "\n\n"...)
 
 	b.mu.RLock()
 	defer b.mu.RUnlock()
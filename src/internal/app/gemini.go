@@ -4,7 +4,9 @@ import (
 	"context"
 	"encoding/json"
 	"errors"
+	"math/rand"
 	"regexp"
+	"strconv"
 	"strings"
 	"sync"
 	"time"
@@ -60,11 +62,39 @@ func (g *geminiClient) loadKeys() {
 	})
 }
 
+// warmGeminiConnection fetches the configured model's metadata once so the
+// first refinement reuses an open TLS connection instead of dialing. The key
+// clients share net/http's default transport, so one request is enough.
+func warmGeminiConnection() {
+	gClient.loadKeys()
+	gClient.mu.Lock()
+	if len(gClient.clients) == 0 {
+		gClient.mu.Unlock()
+		return
+	}
+	c := gClient.clients[0].client
+	gClient.mu.Unlock()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+	started := time.Now()
+	if _, err := c.Models.Get(ctx, geminiModel, nil); err != nil {
+		procErrf("gemini.warm", err, "model=%s", geminiModel)
+		return
+	}
+	procLogf("[GEMINI] connection warmed model=%s elapsed_ms=%d", geminiModel, time.Since(started).Milliseconds())
+}
+
 func hasGeminiConfigured() bool {
 	gClient.loadKeys()
 	return len(gClient.clients) > 0
 }
 
+// refineChunkBytes bounds the transcript text sent per Gemini request. Long
+// transcripts are refined in line-aligned chunks so no single response has to
+// cover the whole lecture and a failed chunk is retried on its own.
+const refineChunkBytes = 48 * 1024
+
 func refineTranscript(rawText, description string) (string, error) {
 	gClient.loadKeys()
 	gClient.mu.Lock()
@@ -74,14 +104,48 @@ func refineTranscript(rawText, description string) (string, error) {
 		return "", errors.New("Gemini API is not configured")
 	}
 
-	prompt := "[Original]\n\"\"\"\n" + normalizeRefineInputText(rawText) + "\n\"\"\"\n\n"
-	if strings.TrimSpace(description) != "" {
-		prompt += "[Reference Context]\n\"\"\"\n" + strings.TrimSpace(description) + "\n\"\"\"\n\n"
+	var ib strings.Builder
+	ib.Grow(len(rawText))
+	writeRefineInputText(&ib, rawText)
+	description = strings.TrimSpace(description)
+
+	chunks := splitRefineInput(ib.String(), refineChunkBytes)
+	var merged refineResponse
+	for i, chunk := range chunks {
+		part, err := refineChunk(chunk, description, clientCount)
+		if err != nil {
+			return "", err
+		}
+		if len(chunks) > 1 {
+			procLogf("[GEMINI] refined chunk=%d/%d bytes=%d", i+1, len(chunks), len(chunk))
+		}
+		merged.Paragraph = append(merged.Paragraph, part.Paragraph...)
 	}
+	out, err := json.MarshalIndent(merged, "", "  ")
+	if err != nil {
+		return "", err
+	}
+	return string(out), nil
+}
+
+func refineChunk(text, description string, clientCount int) (refineResponse, error) {
+	var pb strings.Builder
+	pb.Grow(len(text) + len(description) + 64)
+	pb.WriteString("[Original]\n\"\"\"\n")
+	pb.WriteString(text)
+	pb.WriteString("\n\"\"\"\n\n")
+	if description != "" {
+		pb.WriteString("[Reference Context]\n\"\"\"\n")
+		pb.WriteString(description)
+		pb.WriteString("\n\"\"\"\n\n")
+	}
+	prompt := pb.String()
 
 	var lastErr error = errors.New("gemini request failed")
 	maxAttempts := clientCount * 3
-	for attempt := 0; attempt < maxAttempts; attempt++ {
+	// Waiting out a cooldown does not use up an attempt, so a server-provided
+	// retry delay is honored instead of exhausting the retries while idle.
+	for attempt := 0; attempt < maxAttempts; {
 		idx, waitFor := gClient.nextReadyClient(time.Now())
 		if idx < 0 {
 			if waitFor > 3*time.Second {
@@ -93,9 +157,10 @@ func refineTranscript(rawText, description string) (string, error) {
 			continue
 		}
 
-		text, err := gClient.generate(idx, prompt)
-		if err == nil && strings.TrimSpace(text) != "" {
-			return strings.TrimSpace(text), nil
+		attempt++
+		part, err := gClient.generate(idx, prompt)
+		if err == nil {
+			return part, nil
 		}
 		lastErr = err
 	}
@@ -106,7 +171,26 @@ func refineTranscript(rawText, description string) (string, error) {
 		}
 	}
 	gClient.mu.Unlock()
-	return "", lastErr
+	return refineResponse{}, lastErr
+}
+
+// splitRefineInput cuts text at line breaks into pieces of at most maxBytes.
+// A single line longer than maxBytes is kept whole.
+func splitRefineInput(text string, maxBytes int) []string {
+	var chunks []string
+	for len(text) > maxBytes {
+		cut := strings.LastIndexByte(text[:maxBytes], '\n')
+		if cut <= 0 {
+			next := strings.IndexByte(text[maxBytes:], '\n')
+			if next < 0 {
+				break
+			}
+			cut = maxBytes + next
+		}
+		chunks = append(chunks, text[:cut])
+		text = text[cut+1:]
+	}
+	return append(chunks, text)
 }
 
 func (g *geminiClient) nextReadyClient(now time.Time) (int, time.Duration) {
@@ -132,11 +216,11 @@ func (g *geminiClient) nextReadyClient(now time.Time) (int, time.Duration) {
 	return -1, minWait
 }
 
-func (g *geminiClient) generate(idx int, prompt string) (string, error) {
+func (g *geminiClient) generate(idx int, prompt string) (refineResponse, error) {
 	g.mu.Lock()
 	if idx < 0 || idx >= len(g.clients) {
 		g.mu.Unlock()
-		return "", errors.New("invalid client index")
+		return refineResponse{}, errors.New("invalid client index")
 	}
 	c := g.clients[idx].client
 	keySuffix := maskedKeySuffix(g.clients[idx].key)
@@ -144,10 +228,10 @@ func (g *geminiClient) generate(idx int, prompt string) (string, error) {
 
 	ctx, cancel := context.WithTimeout(context.Background(), 120*time.Second)
 	defer cancel()
-	responseSchema, err := parseRefineResponseSchema()
+	config, err := refineGenerateConfig()
 	if err != nil {
 		g.onFailure(idx, err)
-		return "", err
+		return refineResponse{}, err
 	}
 	result, err := c.Models.GenerateContent(
 		ctx,
@@ -160,43 +244,31 @@ func (g *geminiClient) generate(idx int, prompt string) (string, error) {
 				},
 			},
 		},
-		&genai.GenerateContentConfig{
-			Temperature: genai.Ptr[float32](0.5),
-			SystemInstruction: &genai.Content{
-				Parts: []*genai.Part{
-					{Text: refineSystemPrompt},
-				},
-			},
-			ThinkingConfig: &genai.ThinkingConfig{
-				ThinkingLevel: genai.ThinkingLevelHigh,
-			},
-			ResponseMIMEType: "application/json",
-			ResponseSchema:   responseSchema,
-		},
+		config,
 	)
 	if err != nil {
 		g.onFailure(idx, err)
-		return "", err
+		return refineResponse{}, err
 	}
 	if result == nil {
 		err = errors.New("empty response")
 		g.onFailure(idx, err)
-		return "", err
+		return refineResponse{}, err
 	}
 	text := strings.TrimSpace(result.Text())
 	if text == "" {
 		err = errors.New("empty response text")
 		g.onFailure(idx, err)
-		return "", err
+		return refineResponse{}, err
 	}
-	text, err = normalizeRefineResponseJSON(text)
+	parsed, err := parseRefineResponse(text)
 	if err != nil {
 		g.onFailure(idx, err)
-		return "", err
+		return refineResponse{}, err
 	}
 	g.onSuccess(idx)
 	procLogf("[GEMINI] success api_key_suffix=%s", keySuffix)
-	return text, nil
+	return parsed, nil
 }
 
 const refineResponseSchemaJSON = `{
@@ -266,6 +338,28 @@ type refineSentence struct {
 	Content   string `json:"content"`
 }
 
+// refineGenerateConfig builds the request config, including the parsed
+// response schema, once; it is read-only and shared by every request.
+var refineGenerateConfig = sync.OnceValues(func() (*genai.GenerateContentConfig, error) {
+	responseSchema, err := parseRefineResponseSchema()
+	if err != nil {
+		return nil, err
+	}
+	return &genai.GenerateContentConfig{
+		Temperature: genai.Ptr[float32](0.5),
+		SystemInstruction: &genai.Content{
+			Parts: []*genai.Part{
+				{Text: refineSystemPrompt},
+			},
+		},
+		ThinkingConfig: &genai.ThinkingConfig{
+			ThinkingLevel: genai.ThinkingLevelHigh,
+		},
+		ResponseMIMEType: "application/json",
+		ResponseSchema:   responseSchema,
+	}, nil
+})
+
 func parseRefineResponseSchema() (*genai.Schema, error) {
 	var schema genai.Schema
 	if err := json.Unmarshal([]byte(refineResponseSchemaJSON), &schema); err != nil {
@@ -274,10 +368,11 @@ func parseRefineResponseSchema() (*genai.Schema, error) {
 	return &schema, nil
 }
 
-func normalizeRefineResponseJSON(raw string) (string, error) {
+// parseRefineResponse decodes a response and trims every field.
+func parseRefineResponse(raw string) (refineResponse, error) {
 	var parsed refineResponse
 	if err := json.Unmarshal([]byte(raw), &parsed); err != nil {
-		return "", err
+		return refineResponse{}, err
 	}
 	for i := range parsed.Paragraph {
 		parsed.Paragraph[i].ParagraphSummary = strings.TrimSpace(parsed.Paragraph[i].ParagraphSummary)
@@ -286,28 +381,32 @@ func normalizeRefineResponseJSON(raw string) (string, error) {
 			parsed.Paragraph[i].Sentence[j].Content = strings.TrimSpace(parsed.Paragraph[i].Sentence[j].Content)
 		}
 	}
-	normalized, err := json.MarshalIndent(parsed, "", "  ")
-	if err != nil {
-		return "", err
-	}
-	return string(normalized), nil
+	return parsed, nil
 }
 
-func normalizeRefineInputText(raw string) string {
-	lines := strings.Split(strings.ReplaceAll(strings.TrimSpace(raw), "\r\n", "\n"), "\n")
-	out := make([]string, 0, len(lines))
-	for _, line := range lines {
+// writeRefineInputText writes the non-empty transcript lines joined by "\n",
+// converting legacy "[hh:mm:ss.mmm --> ...]" lines to the current layout.
+func writeRefineInputText(b *strings.Builder, raw string) {
+	first := true
+	for len(raw) > 0 {
+		line, rest, _ := strings.Cut(raw, "\n")
+		raw = rest
 		line = strings.TrimSpace(line)
 		if line == "" {
 			continue
 		}
-		if legacy := legacyTimelineLineRe.FindStringSubmatch(line); len(legacy) == 6 {
-			out = append(out, legacy[1]+","+legacy[2]+" ~ "+legacy[3]+","+legacy[4]+` "`+strings.TrimSpace(legacy[5])+`"`)
-			continue
+		if !first {
+			b.WriteByte('\n')
+		}
+		first = false
+		if line[0] == '[' {
+			if legacy := legacyTimelineLineRe.FindStringSubmatch(line); len(legacy) == 6 {
+				b.WriteString(legacy[1] + "," + legacy[2] + " ~ " + legacy[3] + "," + legacy[4] + ` "` + strings.TrimSpace(legacy[5]) + `"`)
+				continue
+			}
 		}
-		out = append(out, line)
+		b.WriteString(line)
 	}
-	return strings.Join(out, "\n")
 }
 
 func (g *geminiClient) onSuccess(idx int) {
@@ -337,10 +436,41 @@ func (g *geminiClient) onFailure(idx int, err error) {
 	if !isRetryableGeminiError(err) {
 		backoff = 5 * time.Second
 	}
+	// Jitter keeps keys that failed together from retrying in lockstep; a
+	// retry delay sent by the API takes precedence.
+	backoff = backoff/2 + time.Duration(rand.Int63n(int64(backoff/2)+1))
+	if hint, ok := geminiRetryDelay(err); ok {
+		backoff = hint
+	}
 	c.cooldownUntil = time.Now().Add(backoff)
 	procErrf("gemini.generate", err, "api_key_suffix=%s cooldown=%s fail_count=%d", maskedKeySuffix(c.key), backoff, c.failCount)
 }
 
+// geminiRetryDelayRe matches the RetryInfo detail ("retryDelay:17s") and the
+// "Please retry in 17.5s" hint that quota errors carry.
+var geminiRetryDelayRe = regexp.MustCompile(`(?i)(?:retryDelay:|retry in )(\d+(?:\.\d+)?)s`)
+
+const maxGeminiRetryDelay = 2 * time.Minute
+
+func geminiRetryDelay(err error) (time.Duration, bool) {
+	if err == nil {
+		return 0, false
+	}
+	m := geminiRetryDelayRe.FindStringSubmatch(err.Error())
+	if len(m) != 2 {
+		return 0, false
+	}
+	sec, parseErr := strconv.ParseFloat(m[1], 64)
+	if parseErr != nil || sec <= 0 {
+		return 0, false
+	}
+	d := time.Duration(sec * float64(time.Second))
+	if d > maxGeminiRetryDelay {
+		d = maxGeminiRetryDelay
+	}
+	return d, true
+}
+
 func isRetryableGeminiError(err error) bool {
 	if err == nil {
 		return false
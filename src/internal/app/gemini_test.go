@@ -0,0 +1,62 @@
+package app
+
+import (
+	"fmt"
+	"reflect"
+	"strings"
+	"testing"
+)
+
+func TestSplitRefineInput(t *testing.T) {
+	tests := []struct {
+		name     string
+		text     string
+		maxBytes int
+		want     []string
+	}{
+		{name: "empty", text: "", maxBytes: 8, want: []string{""}},
+		{name: "fits", text: "aaa\nbbb", maxBytes: 8, want: []string{"aaa\nbbb"}},
+		{name: "cuts at last line break", text: "aaa\nbbb\nccc\nddd", maxBytes: 8, want: []string{"aaa\nbbb", "ccc\nddd"}},
+		{name: "long line kept whole", text: "xxxxxxxxxxxx\nyy", maxBytes: 5, want: []string{"xxxxxxxxxxxx", "yy"}},
+		{name: "long last line kept whole", text: "aa\nxxxxxxxxxx", maxBytes: 4, want: []string{"aa", "xxxxxxxxxx"}},
+	}
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			got := splitRefineInput(tc.text, tc.maxBytes)
+			if !reflect.DeepEqual(got, tc.want) {
+				t.Fatalf("splitRefineInput(%q, %d) = %q, want %q", tc.text, tc.maxBytes, got, tc.want)
+			}
+		})
+	}
+}
+
+func TestSplitRefineInputKeepsTimelineLinesWhole(t *testing.T) {
+	lines := make([]string, 4000)
+	for i := range lines {
+		lines[i] = fmt.Sprintf(`%02d:%02d:%02d,000 ~ %02d:%02d:%02d,500 "문장 %d"`, i/3600, i/60%60, i%60, i/3600, i/60%60, i%60, i)
+	}
+	text := strings.Join(lines, "\n")
+
+	chunks := splitRefineInput(text, refineChunkBytes)
+	if len(chunks) < 2 {
+		t.Fatalf("expected several chunks, got %d", len(chunks))
+	}
+	next := 0
+	for i, chunk := range chunks {
+		if len(chunk) > refineChunkBytes {
+			t.Fatalf("chunk %d has %d bytes, limit %d", i, len(chunk), refineChunkBytes)
+		}
+		for _, line := range strings.Split(chunk, "\n") {
+			if line != lines[next] {
+				t.Fatalf("chunk %d line %q, want %q", i, line, lines[next])
+			}
+			next++
+		}
+	}
+	if next != len(lines) {
+		t.Fatalf("chunks hold %d lines, want %d", next, len(lines))
+	}
+	if joined := strings.Join(chunks, "\n"); joined != text {
+		t.Fatal("joined chunks differ from the input")
+	}
+}
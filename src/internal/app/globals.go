@@ -34,6 +34,15 @@ var (
 	jobTimeoutSec     int
 	geminiModel       string
 	splitTaskQueues   bool
+	refineWorkers     int
+	whisperModelFile  string
+	whisperThreads    int
+	whisperFlashAttn  bool
+	whisperWorkers    int
+	whisperProcessors int
+	whisperBeamSize   int
+	whisperBestOf     int
+	whisperNoFallback bool
 
 	secureRe   = regexp.MustCompile(`[^A-Za-z0-9_.-]+`)
 	lineRe1    = regexp.MustCompile(`\[(\d{2}):(\d{2}):(\d{2}\.\d+)`)
@@ -98,7 +98,7 @@ func downloadFolderJSONHandler(c echo.Context) error {
 
 	subtree := collectFolderSubtree(u.ID, []string{folderID}, false)
 	subtree[folderID] = struct{}{}
-	snapshot := jobsSnapshot()
+	snapshot := ownerJobsSnapshot(u.ID)
 	buf := bytes.NewBuffer(nil)
 	zw := zip.NewWriter(buf)
 	added := 0
@@ -111,7 +111,7 @@ func downloadFolderJSONHandler(c echo.Context) error {
 		}
 		blobKind := store.BlobKindTranscript
 		suffix := ".txt"
-		if store.HasJobBlob(id, store.BlobKindRefined) {
+		if job.ResultRefined != "" {
 			blobKind = store.BlobKindRefined
 			suffix = "_refined.txt"
 		}
@@ -35,14 +35,17 @@ func apiFilesJSONHandler(c echo.Context) error {
 		}
 	}
 
-	rows := buildRecentJobRowsForUser(u.ID, q, tag)
+	var rows []JobRow
 	folderItems := []FolderRow{}
 	if view == "explore" {
 		rows = buildJobRowsForUser(u.ID, q, tag, folderID, false)
 		folderItems = buildFolderRowsForUser(u.ID, folderID, q)
 		sortFolderRows(folderItems, sortBy, sortOrder)
-	} else if view == "home" {
-		folderItems = recentFolderRowsForUser(u.ID)
+	} else {
+		rows = buildRecentJobRowsForUser(u.ID, q, tag)
+		if view == "home" {
+			folderItems = recentFolderRowsForUser(u.ID)
+		}
 	}
 	sortJobRows(rows, sortBy, sortOrder)
 	pagedRows, page, totalPages := paginateRows(rows, page, pageSize)
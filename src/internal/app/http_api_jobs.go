@@ -39,19 +39,19 @@ func apiJobDetailJSONHandler(c echo.Context) error {
 
 	if job.Status == statusCompleted {
 		showOriginal := strings.TrimSpace(c.QueryParam("original")) == "1" || strings.TrimSpace(c.QueryParam("original")) == "true"
-		hasRefined := store.HasJobBlob(jobID, store.BlobKindRefined)
+		// result_refined is kept in sync with the refined blob, so no lookup is needed.
+		hasRefined := job.ResultRefined != ""
 		useRefined := hasRefined && !showOriginal
 		blobKind := store.BlobKindTranscript
 		if useRefined {
 			blobKind = store.BlobKindRefined
 		}
-		if store.HasJobBlob(jobID, blobKind) {
-			if b, err := store.LoadJobBlob(jobID, blobKind); err == nil {
-				payload["view"] = "result"
-				payload["text"] = string(b)
-				payload["has_refined"] = hasRefined
-				payload["variant"] = map[bool]string{true: "original", false: "refined"}[!useRefined]
-			}
+		// LoadJobBlob hits the result cache; a missing blob just fails the lookup.
+		if b, err := store.LoadJobBlob(jobID, blobKind); err == nil {
+			payload["view"] = "result"
+			payload["text"] = string(b)
+			payload["has_refined"] = hasRefined
+			payload["variant"] = map[bool]string{true: "original", false: "refined"}[!useRefined]
 		}
 		payload["download_url"] = routes.Job(jobID)
 		payload["download_text_url"] = "/download/" + jobID
@@ -59,7 +59,7 @@ func apiJobDetailJSONHandler(c echo.Context) error {
 		return c.JSON(http.StatusOK, payload)
 	}
 
-	if (job.Status == statusRefiningPending || job.Status == statusRefining) && store.HasJobBlob(jobID, store.BlobKindTranscript) {
+	if job.Status == statusRefiningPending || job.Status == statusRefining {
 		if b, err := store.LoadJobBlob(jobID, store.BlobKindTranscript); err == nil {
 			payload["view"] = "preview"
 			payload["original_text"] = string(b)
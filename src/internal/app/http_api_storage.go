@@ -40,7 +40,7 @@ func apiStorageJSONHandler(c echo.Context) error {
 		folderMap[folder.ID] = folder.Name
 	}
 
-	snapshot := jobsSnapshot()
+	snapshot := ownerJobsSnapshot(u.ID)
 	items := make([]storageItem, 0, len(usages))
 	var usedBytes int64
 	for _, usage := range usages {
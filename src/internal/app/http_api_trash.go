@@ -15,6 +15,7 @@ func apiTrashListJSONHandler(c echo.Context) error {
 		return nil
 	}
 	rows := buildJobRowsForUser(u.ID, strings.TrimSpace(c.QueryParam("q")), "", "", true)
+	sortJobRows(rows, "", "desc")
 	folders, _ := store.ListAllFoldersByOwner(u.ID, true)
 	return c.JSON(http.StatusOK, map[string]any{
 		"job_items": rows,
@@ -62,7 +63,7 @@ func clearTrashJSONHandler(c echo.Context) error {
 		return nil
 	}
 
-	snapshot := jobsSnapshot()
+	snapshot := ownerJobsSnapshot(u.ID)
 	toDelete := make([]string, 0)
 	for id, job := range snapshot {
 		if job.OwnerID == u.ID && job.IsTrashed {
@@ -93,7 +94,7 @@ func deleteTrashJobsJSONHandler(c echo.Context) error {
 		return echo.NewHTTPError(http.StatusBadRequest, "잘못된 요청입니다.")
 	}
 
-	snapshot := jobsSnapshot()
+	snapshot := ownerJobsSnapshot(u.ID)
 	toDelete := make([]string, 0, len(body.JobIDs))
 	for _, id := range body.JobIDs {
 		id = strings.TrimSpace(id)
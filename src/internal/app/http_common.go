@@ -21,13 +21,20 @@ func rootRedirectHandler(c echo.Context) error {
 }
 
 func spaIndexHandler(c echo.Context) error {
-	if _, err := os.Stat(spaIndexPath); err != nil {
+	f, err := os.Open(spaIndexPath)
+	if err != nil {
 		if errors.Is(err, os.ErrNotExist) {
 			return c.String(http.StatusServiceUnavailable, "SPA build not found. Run `npm install && npm run build` in ./frontend first.")
 		}
 		return c.String(http.StatusInternalServerError, "Failed to load SPA build.")
 	}
-	return c.File(spaIndexPath)
+	defer f.Close()
+	fi, err := f.Stat()
+	if err != nil {
+		return c.String(http.StatusInternalServerError, "Failed to load SPA build.")
+	}
+	http.ServeContent(c.Response(), c.Request(), fi.Name(), fi.ModTime(), f)
+	return nil
 }
 
 func spaLoginPageHandler(c echo.Context) error {
@@ -68,14 +75,6 @@ func redirectJobsToRootHandler(c echo.Context) error {
 	return c.Redirect(http.StatusMovedPermanently, "/files/home")
 }
 
-func spaTagsPageHandler(c echo.Context) error {
-	return c.Redirect(http.StatusSeeOther, "/files/home")
-}
-
-func spaTrashPageHandler(c echo.Context) error {
-	return spaIndexHandler(c)
-}
-
 func spaUploadPageHandler(c echo.Context) error {
 	return c.Redirect(http.StatusSeeOther, "/files/root")
 }
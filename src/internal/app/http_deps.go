@@ -155,7 +155,7 @@ func buildRecentJobRowsForUser(userID, q, tag string) []JobRow {
 }
 
 func sortJobRows(rows []JobRow, sortBy, sortOrder string) {
-	httpx.SortJobRows(rows, sortBy, sortOrder, uploadedTS)
+	httpx.SortJobRows(rows, sortBy, sortOrder)
 }
 
 func sortFolderRows(rows []FolderRow, sortBy, sortOrder string) {
@@ -172,8 +172,7 @@ func recentFolderRowsForUser(userID string) []FolderRow {
 
 func jobSupportDeps() httpx.JobSupportDeps {
 	return httpx.JobSupportDeps{
-		JobsSnapshot:      jobsSnapshot,
-		UploadedTS:        uploadedTS,
+		OwnerJobsSnapshot: ownerJobsSnapshot,
 		BlobUsageByOwner:  store.JobBlobUsageMapByOwner,
 		NormalizeFolderID: httpx.NormalizeFolderID,
 		IsJobTrashed:      httpx.IsJobTrashed,
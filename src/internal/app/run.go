@@ -41,6 +41,7 @@ func Run() {
 	initAuthHandlers()
 	procLogf("[BOOT] application start")
 	loadJobs()
+	go runJobsSaver()
 	cleanupInactiveTempWavs()
 
 	prometheus.MustRegister(jobsTotal, jobsInProgress, jobDurationSec, uploadBytes, queueLength)
@@ -50,6 +51,15 @@ func Run() {
 		SplitTaskQueues:       splitTaskQueues,
 		TmpFolder:             tmpFolder,
 		ModelDir:              modelDir,
+		ModelFile:             whisperModelFile,
+		Threads:               whisperThreads,
+		FlashAttn:             whisperFlashAttn,
+		TranscribeWorkers:     whisperWorkers,
+		RefineWorkers:         refineWorkers,
+		Processors:            whisperProcessors,
+		BeamSize:              whisperBeamSize,
+		BestOf:                whisperBestOf,
+		NoFallback:            whisperNoFallback,
 		WhisperCLI:            whisperCLI,
 		JobTimeoutSec:         jobTimeoutSec,
 		ProgressRe:            progressRe,
@@ -60,20 +70,20 @@ func Run() {
 		StatusCompleted:       statusCompleted,
 		StatusFailed:          statusFailed,
 	}, worker.Deps{
-		GetJob:                getJob,
-		SetJobFields:          setJobFields,
-		AppendJobPreviewLine:  appendJobPreviewLine,
-		ReplaceJobPreviewText: replaceJobPreviewText,
-		ConvertToWav:          intutil.ConvertToWav,
-		HasGeminiConfigured:   hasGeminiConfigured,
-		RefineTranscript:      refineTranscript,
-		UniqueStrings:         intutil.UniqueStringsKeepOrder,
-		GetTagDescriptions:    store.GetTagDescriptionsByNames,
-		Logf:                  procLogf,
-		Errf:                  procErrf,
-		IncInProgress:         jobsInProgress.Inc,
-		DecInProgress:         jobsInProgress.Dec,
-		SetQueueLength:        queueLength.Set,
+		GetJob:               getJob,
+		SetJobFields:         setJobFields,
+		SetJobProgress:       setJobProgress,
+		AppendJobPreviewLine: appendJobPreviewLine,
+		ConvertToWav:         intutil.ConvertToWav,
+		HasGeminiConfigured:  hasGeminiConfigured,
+		RefineTranscript:     refineTranscript,
+		UniqueStrings:        intutil.UniqueStringsKeepOrder,
+		GetTagDescriptions:   store.GetTagDescriptionsByNames,
+		Logf:                 procLogf,
+		Errf:                 procErrf,
+		IncInProgress:        jobsInProgress.Inc,
+		DecInProgress:        jobsInProgress.Dec,
+		SetQueueLength:       queueLength.Set,
 		IncJobsTotal: func(status string) {
 			jobsTotal.WithLabelValues(status).Inc()
 		},
@@ -81,14 +91,18 @@ func Run() {
 	})
 	appWorker.Start()
 	requeuePending()
+	go warmGeminiConnection()
 
 	e := echo.New()
 	e.HideBanner = true
 	e.Use(middleware.Recover())
 	e.Use(middleware.LoggerWithConfig(middleware.LoggerConfig{
+		// Skip polling routes by their registered path, so no request line is
+		// formatted just to be dropped.
 		Skipper: func(c echo.Context) bool {
 			p := c.Path()
-			return strings.HasPrefix(p, "/status/") || p == "/jobs/updates"
+			return strings.HasPrefix(p, "/status/") || p == "/jobs/updates" ||
+				(p == "/api/jobs/:job_id" && c.Request().Method == http.MethodGet)
 		},
 	}))
 	e.Renderer = view.MustRenderer(templateDir)
@@ -112,9 +126,6 @@ func Run() {
 	e.GET("/files", redirectFilesToHomeHandler)
 	e.GET("/files/home", spaFilesPageHandler)
 	e.GET("/files/root", spaFilesPageHandler)
-	e.GET("/files/folders/:folder_id", spaFilesPageHandler)
-	e.GET("/tags", spaTagsPageHandler)
-	e.GET("/trash", spaTrashPageHandler)
 	e.GET("/upload", spaUploadPageHandler)
 	e.POST("/upload", func(c echo.Context) error { return httpx.UploadPostHandler(c, uploadD) })
 	e.GET("/jobs", redirectJobsToRootHandler)
@@ -208,4 +219,5 @@ func Run() {
 	if appWorker != nil {
 		appWorker.Close()
 	}
+	saveJobsNow()
 }
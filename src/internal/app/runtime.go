@@ -16,10 +16,13 @@ import (
 type Runtime struct {
 	jobsMu sync.RWMutex
 	jobs   map[string]*model.Job
+	// byOwner indexes job ids per owner so per-user listings do not scan
+	// every job on the server. Guarded by jobsMu.
+	byOwner map[string]map[string]struct{}
 }
 
 var (
-	runtimeState = &Runtime{jobs: map[string]*model.Job{}}
+	runtimeState = &Runtime{jobs: map[string]*model.Job{}, byOwner: map[string]map[string]struct{}{}}
 	appWorker    *worker.Worker
 	eventBroker  = newUserEventBroker()
 )
@@ -34,12 +37,50 @@ func jobsSnapshot() map[string]*model.Job {
 	return out
 }
 
+func ownerJobsSnapshot(ownerID string) map[string]*model.Job {
+	runtimeState.jobsMu.RLock()
+	defer runtimeState.jobsMu.RUnlock()
+	ids := runtimeState.byOwner[ownerID]
+	out := make(map[string]*model.Job, len(ids))
+	for id := range ids {
+		if job := runtimeState.jobs[id]; job != nil {
+			out[id] = job.Clone()
+		}
+	}
+	return out
+}
+
+// indexJobOwner and unindexJobOwner keep byOwner in sync; callers hold jobsMu.
+func indexJobOwner(id, ownerID string) {
+	ids := runtimeState.byOwner[ownerID]
+	if ids == nil {
+		ids = map[string]struct{}{}
+		runtimeState.byOwner[ownerID] = ids
+	}
+	ids[id] = struct{}{}
+}
+
+func unindexJobOwner(id, ownerID string) {
+	ids := runtimeState.byOwner[ownerID]
+	delete(ids, id)
+	if len(ids) == 0 {
+		delete(runtimeState.byOwner, ownerID)
+	}
+}
+
 func addJob(id string, job *model.Job) {
 	runtimeState.jobsMu.Lock()
-	defer runtimeState.jobsMu.Unlock()
 	hydrateJobDerivedFields(job)
+	if prev := runtimeState.jobs[id]; prev != nil {
+		unindexJobOwner(id, prev.OwnerID)
+	}
 	runtimeState.jobs[id] = job
-	saveJobsLocked()
+	if job != nil {
+		indexJobOwner(id, job.OwnerID)
+	}
+	runtimeState.jobsMu.Unlock()
+	// Written immediately: job blobs reference the job row.
+	saveJobNow(id)
 	if job != nil {
 		eventBroker.Notify(job.OwnerID, "files.changed", map[string]any{"job_id": id})
 	}
@@ -54,6 +95,7 @@ func removeTempWav(jobID string) {
 		return
 	}
 	_ = os.Remove(tempWavPath(jobID))
+	_ = os.Remove(tempWavPath(jobID) + ".json")
 }
 
 func cleanupInactiveTempWavs() {
@@ -62,8 +104,11 @@ func cleanupInactiveTempWavs() {
 		return
 	}
 	for _, entry := range entries {
-		ext := filepath.Ext(entry.Name())
-		if entry.IsDir() || (ext != ".wav" && ext != ".m4a") {
+		// whisper-cli writes <id>.wav.json next to the wav; a crashed or killed
+		// run leaves it behind.
+		name := entry.Name()
+		ext := filepath.Ext(name)
+		if entry.IsDir() || (ext != ".wav" && ext != ".m4a" && !strings.HasSuffix(name, ".wav.json")) {
 			continue
 		}
 		_ = os.Remove(filepath.Join(tmpFolder, entry.Name()))
@@ -112,19 +157,21 @@ func markSubtreeJobsTrashed(userID string, subtree map[string]struct{}) {
 	}
 	deletedTS := float64(time.Now().Unix())
 	runtimeState.jobsMu.Lock()
-	defer runtimeState.jobsMu.Unlock()
-	for id, job := range runtimeState.jobs {
-		if job.OwnerID != userID {
-			continue
-		}
+	changed := []string{}
+	for id := range runtimeState.byOwner[userID] {
+		job := runtimeState.jobs[id]
 		if _, ok := subtree[httpx.NormalizeFolderID(job.FolderID)]; ok {
 			job.IsTrashed = true
 			job.DeletedTS = deletedTS
 			hydrateJobDerivedFields(job)
-			cancelJob(id)
-			removeTempWav(id)
+			changed = append(changed, id)
 		}
 	}
-	saveJobsLocked()
+	runtimeState.jobsMu.Unlock()
+	for _, id := range changed {
+		cancelJob(id)
+		removeTempWav(id)
+	}
+	scheduleJobsSave(changed...)
 	eventBroker.Notify(userID, "files.changed", nil)
 }
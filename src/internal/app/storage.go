@@ -3,6 +3,7 @@ package app
 import (
 	"regexp"
 	"strings"
+	"sync"
 	"time"
 
 	"whisperserver/src/internal/model"
@@ -20,9 +21,14 @@ func sanitizePreviewLine(line string) string {
 	if line == "" || line == `""` || line == `''` {
 		return ""
 	}
-	line = previewTimelineRe.ReplaceAllString(line, "")
-	line = previewBracketRe.ReplaceAllString(line, "")
-	line = strings.TrimSpace(line)
+	// Both patterns are anchored at a leading '[', so plain text skips them.
+	if line[0] == '[' {
+		line = previewTimelineRe.ReplaceAllString(line, "")
+		if strings.HasPrefix(line, "[") {
+			line = previewBracketRe.ReplaceAllString(line, "")
+		}
+		line = strings.TrimSpace(line)
+	}
 	if line == "" || line == `""` || line == `''` {
 		return ""
 	}
@@ -77,18 +83,35 @@ func requeuePending() {
 
 func deleteJobs(ids []string) {
 	runtimeState.jobsMu.Lock()
-	defer runtimeState.jobsMu.Unlock()
 	owners := map[string]struct{}{}
 	for _, id := range ids {
-		cancelJob(id)
-		if job := runtimeState.jobs[id]; job != nil && job.OwnerID != "" {
-			owners[job.OwnerID] = struct{}{}
+		if job := runtimeState.jobs[id]; job != nil {
+			unindexJobOwner(id, job.OwnerID)
+			if job.OwnerID != "" {
+				owners[job.OwnerID] = struct{}{}
+			}
 		}
+		delete(runtimeState.jobs, id)
+		delete(previewSavedAt, id)
+	}
+	runtimeState.jobsMu.Unlock()
+	for _, id := range ids {
+		cancelJob(id)
 		removeTempWav(id)
 		store.DeleteJobBlobs(id)
-		delete(runtimeState.jobs, id)
 	}
-	saveJobsLocked()
+	// Holding jobsSaveMu keeps a save that cloned one of these jobs before it
+	// left the map from upserting the row back after the delete commits.
+	jobsSaveMu.Lock()
+	jobsDirtyMu.Lock()
+	for _, id := range ids {
+		delete(jobsDirty, id)
+	}
+	jobsDirtyMu.Unlock()
+	if err := store.DeleteJobs(ids); err != nil {
+		procErrf("storage.deleteJobs", err, "count=%d", len(ids))
+	}
+	jobsSaveMu.Unlock()
 	for ownerID := range owners {
 		eventBroker.Notify(ownerID, "files.changed", nil)
 	}
@@ -100,20 +123,104 @@ func loadJobs() {
 		procErrf("storage.loadJobs", err, "load from db failed")
 		return
 	}
-	for _, job := range loaded {
+	byOwner := map[string]map[string]struct{}{}
+	for id, job := range loaded {
 		hydrateJobDerivedFields(job)
+		if byOwner[job.OwnerID] == nil {
+			byOwner[job.OwnerID] = map[string]struct{}{}
+		}
+		byOwner[job.OwnerID][id] = struct{}{}
 	}
 	runtimeState.jobsMu.Lock()
 	runtimeState.jobs = loaded
+	runtimeState.byOwner = byOwner
 	runtimeState.jobsMu.Unlock()
 }
 
-func saveJobsLocked() {
-	if err := store.SaveJobs(runtimeState.jobs); err != nil {
-		procErrf("storage.saveJobs", err, "save to db failed")
+// jobsSaveDelay is how long mutations are coalesced before the background
+// saver writes them, so callers never touch the DB while holding jobsMu.
+const jobsSaveDelay = 500 * time.Millisecond
+
+var (
+	jobsSaveMu      sync.Mutex
+	jobsDirtyMu     sync.Mutex
+	jobsDirty       = map[string]struct{}{}
+	jobsSavePending = make(chan struct{}, 1)
+)
+
+// scheduleJobsSave marks jobs as changed; only those rows are written on the
+// next flush.
+func scheduleJobsSave(ids ...string) {
+	jobsDirtyMu.Lock()
+	for _, id := range ids {
+		jobsDirty[id] = struct{}{}
+	}
+	jobsDirtyMu.Unlock()
+	select {
+	case jobsSavePending <- struct{}{}:
+	default:
+	}
+}
+
+func runJobsSaver() {
+	for range jobsSavePending {
+		time.Sleep(jobsSaveDelay)
+		saveJobsNow()
 	}
 }
 
+func saveJobsNow() {
+	jobsSaveMu.Lock()
+	defer jobsSaveMu.Unlock()
+
+	jobsDirtyMu.Lock()
+	ids := jobsDirty
+	jobsDirty = map[string]struct{}{}
+	jobsDirtyMu.Unlock()
+	if len(ids) == 0 {
+		return
+	}
+
+	changed := make(map[string]*model.Job, len(ids))
+	runtimeState.jobsMu.RLock()
+	for id := range ids {
+		if job := runtimeState.jobs[id]; job != nil {
+			changed[id] = job.Clone()
+		}
+	}
+	runtimeState.jobsMu.RUnlock()
+	if err := store.UpsertJobs(changed); err != nil {
+		procErrf("storage.saveJobs", err, "save to db failed count=%d", len(changed))
+		scheduleJobsSave(keysOf(ids)...)
+	}
+}
+
+// saveJobNow writes a single job synchronously without flushing the rest of
+// the dirty set, so concurrent uploads do not each sweep every pending save.
+func saveJobNow(id string) {
+	jobsSaveMu.Lock()
+	defer jobsSaveMu.Unlock()
+
+	runtimeState.jobsMu.RLock()
+	job := runtimeState.jobs[id].Clone()
+	runtimeState.jobsMu.RUnlock()
+	if job == nil {
+		return
+	}
+	if err := store.UpsertJobs(map[string]*model.Job{id: job}); err != nil {
+		procErrf("storage.saveJob", err, "save to db failed job_id=%s", id)
+		scheduleJobsSave(id)
+	}
+}
+
+func keysOf(m map[string]struct{}) []string {
+	out := make([]string, 0, len(m))
+	for k := range m {
+		out = append(out, k)
+	}
+	return out
+}
+
 func getJob(id string) *model.Job {
 	runtimeState.jobsMu.RLock()
 	defer runtimeState.jobsMu.RUnlock()
@@ -123,14 +230,46 @@ func getJob(id string) *model.Job {
 
 func setJobFields(id string, fields map[string]any) {
 	runtimeState.jobsMu.Lock()
-	defer runtimeState.jobsMu.Unlock()
 	job := runtimeState.jobs[id]
 	if job == nil {
+		runtimeState.jobsMu.Unlock()
 		return
 	}
+	prevOwner := job.OwnerID
 	applyJobFields(job, fields)
-	saveJobsLocked()
-	eventBroker.Notify(job.OwnerID, "files.changed", map[string]any{"job_id": id})
+	if _, ok := fields["status"]; ok && job.Status != statusRunning {
+		// Transcription finished or failed; its preview throttle is done.
+		delete(previewSavedAt, id)
+	}
+	if job.OwnerID != prevOwner {
+		unindexJobOwner(id, prevOwner)
+		indexJobOwner(id, job.OwnerID)
+	}
+	ownerID := job.OwnerID
+	runtimeState.jobsMu.Unlock()
+	scheduleJobsSave(id)
+	eventBroker.Notify(ownerID, "files.changed", map[string]any{"job_id": id})
+}
+
+// setJobProgress is the progress-tick path of setJobFields: it touches only
+// phase/percent and the label derived from them. Progress is kept in memory
+// only; the row is written on the next status change, and interrupted jobs
+// restart from 0 when requeued anyway. It emits job.progress rather than
+// files.changed so listeners that only care about file changes (storage
+// usage) do not refetch on every tick.
+func setJobProgress(id, phase string, percent int) {
+	runtimeState.jobsMu.Lock()
+	job := runtimeState.jobs[id]
+	if job == nil {
+		runtimeState.jobsMu.Unlock()
+		return
+	}
+	job.Phase = phase
+	job.ProgressPercent = percent
+	job.ProgressLabel = deriveJobProgressLabel(job)
+	ownerID := job.OwnerID
+	runtimeState.jobsMu.Unlock()
+	eventBroker.Notify(ownerID, "job.progress", map[string]any{"job_id": id})
 }
 
 func applyJobFields(job *model.Job, fields map[string]any) {
@@ -202,12 +341,9 @@ func applyJobFields(job *model.Job, fields map[string]any) {
 
 func removeTagFromOwnerJobs(ownerID, tagName string) {
 	runtimeState.jobsMu.Lock()
-	defer runtimeState.jobsMu.Unlock()
-	changed := false
-	for _, job := range runtimeState.jobs {
-		if job.OwnerID != ownerID {
-			continue
-		}
+	changed := []string{}
+	for id := range runtimeState.byOwner[ownerID] {
+		job := runtimeState.jobs[id]
 		tags := append([]string(nil), job.Tags...)
 		if len(tags) == 0 {
 			continue
@@ -223,11 +359,12 @@ func removeTagFromOwnerJobs(ownerID, tagName string) {
 		}
 		if removed {
 			job.Tags = next
-			changed = true
+			changed = append(changed, id)
 		}
 	}
-	if changed {
-		saveJobsLocked()
+	runtimeState.jobsMu.Unlock()
+	if len(changed) > 0 {
+		scheduleJobsSave(changed...)
 		eventBroker.Notify(ownerID, "files.changed", nil)
 	}
 }
@@ -240,9 +377,9 @@ func appendJobPreviewLine(id, line string) {
 	const maxPreviewChars = 40000
 
 	runtimeState.jobsMu.Lock()
-	defer runtimeState.jobsMu.Unlock()
 	job := runtimeState.jobs[id]
 	if job == nil {
+		runtimeState.jobsMu.Unlock()
 		return
 	}
 
@@ -258,35 +395,34 @@ func appendJobPreviewLine(id, line string) {
 	}
 
 	job.PreviewText = prev
-	if err := store.SaveJobBlob(id, store.BlobKindPreview, []byte(prev)); err != nil {
-		procErrf("storage.savePreviewBlob", err, "job_id=%s", id)
+	persist := previewSaveDue(id)
+	runtimeState.jobsMu.Unlock()
+	if persist {
+		savePreviewBlob(id, prev)
 	}
 }
 
-func replaceJobPreviewText(id, text string) {
-	text = strings.TrimSpace(text)
+// previewSaveInterval caps how often the live preview is written to the DB.
+// The in-memory preview is updated on every line; the blob only matters for
+// showing progress again after a restart.
+const previewSaveInterval = time.Second
 
-	runtimeState.jobsMu.Lock()
-	defer runtimeState.jobsMu.Unlock()
-	job := runtimeState.jobs[id]
-	if job == nil {
-		return
-	}
+// previewSavedAt is guarded by runtimeState.jobsMu.
+var previewSavedAt = map[string]time.Time{}
 
-	job.PreviewText = text
-	if err := store.SaveJobBlob(id, store.BlobKindPreview, []byte(text)); err != nil {
-		procErrf("storage.savePreviewBlob", err, "job_id=%s", id)
+func previewSaveDue(id string) bool {
+	now := time.Now()
+	if now.Sub(previewSavedAt[id]) < previewSaveInterval {
+		return false
 	}
+	previewSavedAt[id] = now
+	return true
 }
 
-func uploadedTS(id string) float64 {
-	runtimeState.jobsMu.RLock()
-	defer runtimeState.jobsMu.RUnlock()
-	job := runtimeState.jobs[id]
-	if job == nil {
-		return 0
+func savePreviewBlob(id, text string) {
+	if err := store.SaveJobBlob(id, store.BlobKindPreview, []byte(text)); err != nil {
+		procErrf("storage.savePreviewBlob", err, "job_id=%s", id)
 	}
-	return job.UploadedTS
 }
 
 func hydrateJobDerivedFields(job *model.Job) {
@@ -0,0 +1,71 @@
+package app
+
+import (
+	"testing"
+
+	"whisperserver/src/internal/model"
+	"whisperserver/src/internal/store"
+)
+
+func TestDeleteJobsDropsPendingSave(t *testing.T) {
+	if err := store.Init(t.TempDir()); err != nil {
+		t.Fatalf("store init: %v", err)
+	}
+	t.Cleanup(store.Close)
+
+	const id = "job-delete-dirty"
+	addJob(id, &model.Job{Status: statusPending, Filename: "a.m4a"})
+	setJobFields(id, map[string]any{"phase": "업로드 처리 중"})
+
+	jobsDirtyMu.Lock()
+	_, dirty := jobsDirty[id]
+	jobsDirtyMu.Unlock()
+	if !dirty {
+		t.Fatalf("expected %s to be marked dirty", id)
+	}
+
+	deleteJobs([]string{id})
+	saveJobsNow()
+
+	jobsDirtyMu.Lock()
+	_, dirty = jobsDirty[id]
+	jobsDirtyMu.Unlock()
+	if dirty {
+		t.Fatalf("deleted job %s is still marked dirty", id)
+	}
+	loaded, err := store.LoadJobs()
+	if err != nil {
+		t.Fatalf("load jobs: %v", err)
+	}
+	if _, ok := loaded[id]; ok {
+		t.Fatalf("deleted job %s was written back", id)
+	}
+}
+
+func TestSetJobFieldsDropsPreviewThrottleWhenTranscriptionEnds(t *testing.T) {
+	if err := store.Init(t.TempDir()); err != nil {
+		t.Fatalf("store init: %v", err)
+	}
+	t.Cleanup(store.Close)
+
+	const id = "job-preview-throttle"
+	addJob(id, &model.Job{Status: statusPending, Filename: "a.m4a"})
+	t.Cleanup(func() { deleteJobs([]string{id}) })
+	setJobFields(id, map[string]any{"status": statusRunning})
+	appendJobPreviewLine(id, "[00:00:00.000 --> 00:00:02.000] 안녕하세요")
+
+	runtimeState.jobsMu.RLock()
+	_, tracked := previewSavedAt[id]
+	runtimeState.jobsMu.RUnlock()
+	if !tracked {
+		t.Fatalf("expected a preview save entry for %s", id)
+	}
+
+	setJobFields(id, map[string]any{"status": statusCompleted})
+	runtimeState.jobsMu.RLock()
+	_, tracked = previewSavedAt[id]
+	runtimeState.jobsMu.RUnlock()
+	if tracked {
+		t.Fatalf("preview save entry for %s kept after completion", id)
+	}
+}
@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"net/http"
 	"path/filepath"
+	"strconv"
 	"strings"
 	"time"
 
@@ -45,6 +46,7 @@ func downloadBlobHandler(c echo.Context, deps JobsDeps, kind, suffix, notFoundMe
 	if kind == store.BlobKindRefined && strings.HasSuffix(suffix, ".json") {
 		contentType = "application/json; charset=utf-8"
 	}
+	c.Response().Header().Set(echo.HeaderContentLength, strconv.Itoa(len(b)))
 	return c.Blob(http.StatusOK, contentType, b)
 }
 
@@ -73,7 +75,7 @@ func BatchDownloadHandler(c echo.Context, deps JobsDeps) error {
 		}
 		blobKind := store.BlobKindTranscript
 		ext := ".txt"
-		if store.HasJobBlob(id, store.BlobKindRefined) {
+		if job.ResultRefined != "" {
 			blobKind = store.BlobKindRefined
 			ext = "_refined.json"
 		}
@@ -100,5 +102,6 @@ func BatchDownloadHandler(c echo.Context, deps JobsDeps) error {
 	deps.Logf("[BATCH_DOWNLOAD] success selected=%d added=%d", len(ids), added)
 	zipName := "whisper_results_" + time.Now().Format("20060102_150405") + ".zip"
 	c.Response().Header().Set(echo.HeaderContentDisposition, fmt.Sprintf(`attachment; filename="%s"`, zipName))
+	c.Response().Header().Set(echo.HeaderContentLength, strconv.Itoa(buf.Len()))
 	return c.Blob(http.StatusOK, "application/zip", buf.Bytes())
 }
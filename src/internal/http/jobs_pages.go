@@ -1,8 +1,9 @@
 package httpx
 
 import (
+	"database/sql"
 	"encoding/json"
-	"html"
+	"errors"
 	"net/http"
 	"strings"
 
@@ -44,14 +45,17 @@ func JobsHandler(c echo.Context, deps JobsDeps) error {
 		}
 	}
 
-	rows := deps.BuildRecentJobRows(u.ID, q, tag)
+	var rows []JobRow
 	folderItems := []FolderRow{}
 	if view == "explore" {
 		rows = deps.BuildJobRows(u.ID, q, tag, folderID, false)
 		folderItems = deps.BuildFolderRows(u.ID, folderID, q)
 		deps.SortFolderRows(folderItems, sortBy, sortOrder)
-	} else if view == "home" {
-		folderItems = deps.RecentFolderRows(u.ID)
+	} else {
+		rows = deps.BuildRecentJobRows(u.ID, q, tag)
+		if view == "home" {
+			folderItems = deps.RecentFolderRows(u.ID)
+		}
 	}
 	deps.SortJobRows(rows, sortBy, sortOrder)
 	pagedRows, page, totalPages := deps.PaginateRows(rows, page, pageSize)
@@ -114,14 +118,17 @@ func JobsUpdatesHandler(c echo.Context, deps JobsDeps) error {
 		view = "explore"
 	}
 
-	rows := deps.BuildRecentJobRows(u.ID, q, tag)
+	var rows []JobRow
 	folderItems := []FolderRow{}
 	if view == "explore" {
 		rows = deps.BuildJobRows(u.ID, q, tag, folderID, false)
 		folderItems = deps.BuildFolderRows(u.ID, folderID, q)
 		deps.SortFolderRows(folderItems, sortBy, sortOrder)
-	} else if view == "home" {
-		folderItems = deps.RecentFolderRows(u.ID)
+	} else {
+		rows = deps.BuildRecentJobRows(u.ID, q, tag)
+		if view == "home" {
+			folderItems = deps.RecentFolderRows(u.ID)
+		}
 	}
 	deps.SortJobRows(rows, sortBy, sortOrder)
 	pagedRows, page, totalPages := deps.PaginateRows(rows, page, pageSize)
@@ -157,6 +164,7 @@ func TrashPageHandler(c echo.Context, deps JobsDeps) error {
 		return c.Redirect(http.StatusSeeOther, routes.Login)
 	}
 	rows := deps.BuildJobRows(u.ID, c.QueryParam("q"), c.QueryParam("tag"), "", true)
+	deps.SortJobRows(rows, "", "desc")
 	return c.Render(http.StatusOK, "files_trash.html", map[string]any{
 		"JobItems":        rows,
 		"CurrentUserName": deps.CurrentUserName(c),
@@ -180,6 +188,10 @@ func StatusHandler(c echo.Context, deps JobsDeps) error {
 	})
 }
 
+// textBreakReplacer HTML-escapes text like html.EscapeString and turns
+// newlines into <br> in the same pass.
+var textBreakReplacer = strings.NewReplacer("&", "&amp;", "'", "&#39;", "<", "&lt;", ">", "&gt;", `"`, "&#34;", "\n", "<br>")
+
 func JobHandler(c echo.Context, deps JobsDeps) error {
 	jobID := c.Param("job_id")
 	job, u, err := deps.RequireOwnedJob(c, jobID, false)
@@ -197,17 +209,16 @@ func JobHandler(c echo.Context, deps JobsDeps) error {
 	tagText := strings.Join(selectedTags, ", ")
 
 	if status == "정제 대기 중" || status == "정제 중" {
-		if store.HasJobBlob(jobID, store.BlobKindTranscript) {
-			b, err := store.LoadJobBlob(jobID, store.BlobKindTranscript)
-			if err != nil {
-				deps.Errf("job.loadTranscriptBlob", err, "job_id=%s", jobID)
-				return echo.NewHTTPError(http.StatusInternalServerError, "원본 결과 읽기 실패")
-			}
-			esc := html.EscapeString(string(b))
+		b, err := store.LoadJobBlob(jobID, store.BlobKindTranscript)
+		if err != nil && !errors.Is(err, sql.ErrNoRows) {
+			deps.Errf("job.loadTranscriptBlob", err, "job_id=%s", jobID)
+			return echo.NewHTTPError(http.StatusInternalServerError, "원본 결과 읽기 실패")
+		}
+		if err == nil {
 			return c.Render(http.StatusOK, "job_preview.html", map[string]any{
 				"Job":              deps.ToJobView(job),
 				"JobID":            jobID,
-				"OriginalTextHTML": strings.ReplaceAll(esc, "\n", "<br>"),
+				"OriginalTextHTML": textBreakReplacer.Replace(string(b)),
 				"CurrentUserName":  deps.CurrentUserName(c),
 				"Tags":             tags,
 				"SelectedTagsMap":  tagMap,
@@ -219,16 +230,16 @@ func JobHandler(c echo.Context, deps JobsDeps) error {
 
 	if status == "완료" {
 		showOriginal := strings.TrimSpace(c.QueryParam("original")) == "1" || strings.TrimSpace(c.QueryParam("original")) == "true"
-		hasRefined := store.HasJobBlob(jobID, store.BlobKindRefined)
+		hasRefined := job.ResultRefined != ""
 		useRefined := hasRefined && !showOriginal
 		blobKind := store.BlobKindTranscript
 		if useRefined {
 			blobKind = store.BlobKindRefined
 		}
-		if !store.HasJobBlob(jobID, blobKind) {
+		b, err := store.LoadJobBlob(jobID, blobKind)
+		if errors.Is(err, sql.ErrNoRows) {
 			return echo.NewHTTPError(http.StatusNotFound, "결과 파일을 찾을 수 없습니다.")
 		}
-		b, err := store.LoadJobBlob(jobID, blobKind)
 		if err != nil {
 			deps.Errf("job.loadResultBlob", err, "job_id=%s kind=%s", jobID, blobKind)
 			return echo.NewHTTPError(http.StatusInternalServerError, "결과 읽기 실패")
@@ -12,8 +12,7 @@ import (
 )
 
 type JobSupportDeps struct {
-	JobsSnapshot      func() map[string]*model.Job
-	UploadedTS        func(string) float64
+	OwnerJobsSnapshot func(string) map[string]*model.Job
 	BlobUsageByOwner  func(string) (map[string]int64, error)
 	NormalizeFolderID func(string) string
 	IsJobTrashed      func(*model.Job) bool
@@ -21,6 +20,8 @@ type JobSupportDeps struct {
 	Errf              func(string, error, string, ...any)
 }
 
+// BuildJobRowsForUser and BuildRecentJobRowsForUser return rows unordered;
+// callers order them once with SortJobRows.
 func BuildJobRowsForUser(userID, q, tag, folderID string, trashed bool, deps JobSupportDeps) []JobRow {
 	qNorm := norm.NFC.String(strings.ToLower(q))
 	tag = strings.TrimSpace(tag)
@@ -32,11 +33,11 @@ func BuildJobRowsForUser(userID, q, tag, folderID string, trashed bool, deps Job
 		folderMap[f.ID] = f.Name
 	}
 
-	snapshot := deps.JobsSnapshot()
+	snapshot := deps.OwnerJobsSnapshot(userID)
 	sizeMap, _ := deps.BlobUsageByOwner(userID)
 	rows := make([]JobRow, 0, len(snapshot))
 	for id, job := range snapshot {
-		if job.OwnerID != userID || deps.IsJobTrashed(job) != trashed {
+		if deps.IsJobTrashed(job) != trashed {
 			continue
 		}
 		if !trashed && deps.NormalizeFolderID(job.FolderID) != folderID {
@@ -61,6 +62,7 @@ func BuildJobRowsForUser(userID, q, tag, folderID string, trashed bool, deps Job
 
 		rows = append(rows, JobRow{
 			ID:              id,
+			UploadedTS:      job.UploadedTS,
 			Filename:        filename,
 			FileType:        job.FileType,
 			MediaDuration:   deps.Fallback(job.MediaDuration, "-"),
@@ -79,7 +81,6 @@ func BuildJobRowsForUser(userID, q, tag, folderID string, trashed bool, deps Job
 			FolderName:      fName,
 		})
 	}
-	sort.Slice(rows, func(i, j int) bool { return deps.UploadedTS(rows[i].ID) > deps.UploadedTS(rows[j].ID) })
 	return rows
 }
 
@@ -111,11 +112,11 @@ func BuildRecentJobRowsForUser(userID, q, tag string, deps JobSupportDeps) []Job
 		folderMap[f.ID] = f.Name
 	}
 
-	snapshot := deps.JobsSnapshot()
+	snapshot := deps.OwnerJobsSnapshot(userID)
 	sizeMap, _ := deps.BlobUsageByOwner(userID)
 	rows := make([]JobRow, 0, len(snapshot))
 	for id, job := range snapshot {
-		if job.OwnerID != userID || deps.IsJobTrashed(job) {
+		if deps.IsJobTrashed(job) {
 			continue
 		}
 		filename := job.Filename
@@ -137,6 +138,7 @@ func BuildRecentJobRowsForUser(userID, q, tag string, deps JobSupportDeps) []Job
 
 		rows = append(rows, JobRow{
 			ID:              id,
+			UploadedTS:      job.UploadedTS,
 			Filename:        filename,
 			FileType:        job.FileType,
 			MediaDuration:   deps.Fallback(job.MediaDuration, "-"),
@@ -155,11 +157,10 @@ func BuildRecentJobRowsForUser(userID, q, tag string, deps JobSupportDeps) []Job
 			FolderName:      fName,
 		})
 	}
-	sort.Slice(rows, func(i, j int) bool { return deps.UploadedTS(rows[i].ID) > deps.UploadedTS(rows[j].ID) })
 	return rows
 }
 
-func SortJobRows(rows []JobRow, sortBy, sortOrder string, uploadedTS func(string) float64) {
+func SortJobRows(rows []JobRow, sortBy, sortOrder string) {
 	desc := sortOrder == "desc"
 	switch sortBy {
 	case "name":
@@ -168,9 +169,9 @@ func SortJobRows(rows []JobRow, sortBy, sortOrder string, uploadedTS func(string
 			b := strings.ToLower(rows[j].Filename)
 			if a == b {
 				if desc {
-					return uploadedTS(rows[i].ID) > uploadedTS(rows[j].ID)
+					return rows[i].UploadedTS > rows[j].UploadedTS
 				}
-				return uploadedTS(rows[i].ID) < uploadedTS(rows[j].ID)
+				return rows[i].UploadedTS < rows[j].UploadedTS
 			}
 			if desc {
 				return a > b
@@ -180,9 +181,9 @@ func SortJobRows(rows []JobRow, sortBy, sortOrder string, uploadedTS func(string
 	default:
 		sort.Slice(rows, func(i, j int) bool {
 			if desc {
-				return uploadedTS(rows[i].ID) > uploadedTS(rows[j].ID)
+				return rows[i].UploadedTS > rows[j].UploadedTS
 			}
-			return uploadedTS(rows[i].ID) < uploadedTS(rows[j].ID)
+			return rows[i].UploadedTS < rows[j].UploadedTS
 		})
 	}
 }
@@ -17,6 +17,7 @@ type JobView struct {
 
 type JobRow struct {
 	ID              string
+	UploadedTS      float64 `json:"-"`
 	Filename        string
 	FileType        string
 	MediaDuration   string
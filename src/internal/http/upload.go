@@ -28,7 +28,7 @@ type UploadDeps struct {
 	SecureFilename      func(string) string
 	SaveUploadWithLimit func(*multipart.FileHeader, string, int64, int64) (int64, error)
 	IsUploadTooLarge    func(error) bool
-	ConvertToAac        func(string, string) error
+	ConvertToAac        func(string, string) (*int, error)
 	GetMediaDuration    func(string) *int
 	FormatSecondsPtr    func(*int) string
 	AddJob              func(string, *model.Job)
@@ -194,18 +194,21 @@ func createUploadedJob(c echo.Context, ownerID string, fileHeader *multipart.Fil
 }
 
 func finalizeUploadedAudio(jobID, tempPath, aacPath string, deps UploadDeps) {
+	// The ffmpeg call below takes a slot from util's conversion limiter, so a
+	// burst of uploads queues there.
 	defer func() {
 		_ = os.Remove(tempPath)
 		_ = os.Remove(aacPath)
 	}()
 
-	if err := deps.ConvertToAac(tempPath, aacPath); err != nil {
+	duration, err := deps.ConvertToAac(tempPath, aacPath)
+	if err != nil {
 		deps.Errf("upload.convertToAac", err, "job_id=%s src=%s dst=%s", jobID, tempPath, aacPath)
 		deps.SetJobFields(jobID, map[string]any{
-			"status":        deps.StatusFailed,
-			"phase":         "업로드 처리 실패",
+			"status":         deps.StatusFailed,
+			"phase":          "업로드 처리 실패",
 			"progress_label": "",
-			"status_detail": "ffmpeg 변환 실패",
+			"status_detail":  "ffmpeg 변환 실패",
 		})
 		return
 	}
@@ -214,10 +217,10 @@ func finalizeUploadedAudio(jobID, tempPath, aacPath string, deps UploadDeps) {
 	if err != nil {
 		deps.Errf("upload.readAac", err, "job_id=%s path=%s", jobID, aacPath)
 		deps.SetJobFields(jobID, map[string]any{
-			"status":        deps.StatusFailed,
-			"phase":         "업로드 처리 실패",
+			"status":         deps.StatusFailed,
+			"phase":          "업로드 처리 실패",
 			"progress_label": "",
-			"status_detail": "업로드 파일 처리 실패",
+			"status_detail":  "업로드 파일 처리 실패",
 		})
 		return
 	}
@@ -225,15 +228,23 @@ func finalizeUploadedAudio(jobID, tempPath, aacPath string, deps UploadDeps) {
 	if err := store.SaveJobBlob(jobID, store.BlobKindAudioAAC, aacBytes); err != nil {
 		deps.Errf("upload.saveAudioBlob", err, "job_id=%s", jobID)
 		deps.SetJobFields(jobID, map[string]any{
-			"status":        deps.StatusFailed,
-			"phase":         "업로드 처리 실패",
+			"status":         deps.StatusFailed,
+			"phase":          "업로드 처리 실패",
 			"progress_label": "",
-			"status_detail": "오디오 파일 저장 실패",
+			"status_detail":  "오디오 파일 저장 실패",
 		})
 		return
 	}
 
-	duration := deps.GetMediaDuration(aacPath)
+	if duration == nil && strings.EqualFold(filepath.Ext(tempPath), ".wav") {
+		// wav sources resolve from their header without ffprobe.
+		duration = deps.GetMediaDuration(tempPath)
+	}
+	if duration == nil {
+		// ffmpeg prints "Duration: N/A" for streamed containers (e.g. browser
+		// webm/ogg recordings); the m4a it wrote always carries one.
+		duration = deps.GetMediaDuration(aacPath)
+	}
 	deps.SetJobFields(jobID, map[string]any{
 		"media_duration_seconds": duration,
 		"phase":                  "",
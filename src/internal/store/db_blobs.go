@@ -1,6 +1,10 @@
 package store
 
-import "fmt"
+import (
+	"container/list"
+	"fmt"
+	"sync"
+)
 
 type JobBlobUsage struct {
 	JobID     string
@@ -8,6 +12,143 @@ type JobBlobUsage struct {
 	BlobCount int
 }
 
+// resultCacheSize bounds how many finished transcripts are kept in memory.
+// Cached slices are shared, so callers must not modify loaded blobs.
+const resultCacheSize = 64
+
+type blobKey struct {
+	jobID string
+	kind  string
+}
+
+type cachedBlob struct {
+	key  blobKey
+	data []byte
+}
+
+var resultCache = struct {
+	mu    sync.Mutex
+	gen   uint64
+	lru   *list.List
+	items map[blobKey]*list.Element
+}{lru: list.New(), items: map[blobKey]*list.Element{}}
+
+// blobPresence remembers blobs known to exist, so HasJobBlob checks repeated by
+// polled pages skip the COUNT query. Only the kinds those pages check are
+// tracked, keyed by job so deletes drop a job's entries directly; an entry
+// therefore lives no longer than its blob row. Deletes also bump the cache
+// generation after the row is gone, so a lookup racing a delete is not kept.
+var blobPresence = struct {
+	mu    sync.Mutex
+	known map[string]map[string]struct{}
+}{known: map[string]map[string]struct{}{}}
+
+func tracksBlobPresence(kind string) bool {
+	return kind == BlobKindAudioAAC || kind == BlobKindTranscript || kind == BlobKindRefined
+}
+
+func markBlobPresent(jobID, kind string, gen uint64) {
+	if !tracksBlobPresence(kind) {
+		return
+	}
+	blobPresence.mu.Lock()
+	defer blobPresence.mu.Unlock()
+	if gen != resultCacheGen() {
+		return
+	}
+	kinds := blobPresence.known[jobID]
+	if kinds == nil {
+		kinds = map[string]struct{}{}
+		blobPresence.known[jobID] = kinds
+	}
+	kinds[kind] = struct{}{}
+}
+
+func blobKnownPresent(jobID, kind string) bool {
+	blobPresence.mu.Lock()
+	defer blobPresence.mu.Unlock()
+	_, ok := blobPresence.known[jobID][kind]
+	return ok
+}
+
+// forgetBlobs drops presence entries for jobID; no kinds means all kinds.
+func forgetBlobs(jobID string, kinds ...string) {
+	blobPresence.mu.Lock()
+	defer blobPresence.mu.Unlock()
+	known := blobPresence.known[jobID]
+	if known == nil {
+		return
+	}
+	for _, kind := range kinds {
+		delete(known, kind)
+	}
+	if len(kinds) == 0 || len(known) == 0 {
+		delete(blobPresence.known, jobID)
+	}
+}
+
+func isResultBlobKind(kind string) bool {
+	return kind == BlobKindTranscript || kind == BlobKindRefined
+}
+
+func resultCacheGen() uint64 {
+	resultCache.mu.Lock()
+	defer resultCache.mu.Unlock()
+	return resultCache.gen
+}
+
+// cacheResultBlob stores data for a result blob. A load started at gen is
+// only cached if no write or delete happened in the meantime.
+func cacheResultBlob(jobID, kind string, data []byte, gen uint64) {
+	if !isResultBlobKind(kind) {
+		return
+	}
+	key := blobKey{jobID: jobID, kind: kind}
+	resultCache.mu.Lock()
+	defer resultCache.mu.Unlock()
+	if gen != resultCache.gen {
+		return
+	}
+	if el, ok := resultCache.items[key]; ok {
+		el.Value.(*cachedBlob).data = data
+		resultCache.lru.MoveToFront(el)
+		return
+	}
+	resultCache.items[key] = resultCache.lru.PushFront(&cachedBlob{key: key, data: data})
+	if resultCache.lru.Len() > resultCacheSize {
+		oldest := resultCache.lru.Back()
+		resultCache.lru.Remove(oldest)
+		delete(resultCache.items, oldest.Value.(*cachedBlob).key)
+	}
+}
+
+func cachedResultBlob(jobID, kind string) ([]byte, bool) {
+	if !isResultBlobKind(kind) {
+		return nil, false
+	}
+	resultCache.mu.Lock()
+	defer resultCache.mu.Unlock()
+	el, ok := resultCache.items[blobKey{jobID: jobID, kind: kind}]
+	if !ok {
+		return nil, false
+	}
+	resultCache.lru.MoveToFront(el)
+	return el.Value.(*cachedBlob).data, true
+}
+
+func dropCachedResultBlobs(jobID string, kinds ...string) {
+	resultCache.mu.Lock()
+	defer resultCache.mu.Unlock()
+	resultCache.gen++
+	for _, kind := range kinds {
+		key := blobKey{jobID: jobID, kind: kind}
+		if el, ok := resultCache.items[key]; ok {
+			resultCache.lru.Remove(el)
+			delete(resultCache.items, key)
+		}
+	}
+}
+
 func SaveJobBlob(jobID, kind string, data []byte) error {
 	if dbConn == nil {
 		return fmt.Errorf("db is not initialized")
@@ -16,18 +157,30 @@ func SaveJobBlob(jobID, kind string, data []byte) error {
 		INSERT INTO job_blobs(job_id, kind, data, updated_at) VALUES (?, ?, ?, CURRENT_TIMESTAMP)
 		ON CONFLICT(job_id, kind) DO UPDATE SET data=excluded.data, updated_at=CURRENT_TIMESTAMP
 	`, jobID, kind, data)
-	return err
+	dropCachedResultBlobs(jobID, kind)
+	if err != nil {
+		return err
+	}
+	gen := resultCacheGen()
+	cacheResultBlob(jobID, kind, data, gen)
+	markBlobPresent(jobID, kind, gen)
+	return nil
 }
 
 func LoadJobBlob(jobID, kind string) ([]byte, error) {
 	if dbConn == nil {
 		return nil, fmt.Errorf("db is not initialized")
 	}
+	if b, ok := cachedResultBlob(jobID, kind); ok {
+		return b, nil
+	}
+	gen := resultCacheGen()
 	var b []byte
 	err := dbConn.QueryRow(`SELECT data FROM job_blobs WHERE job_id = ? AND kind = ?`, jobID, kind).Scan(&b)
 	if err != nil {
 		return nil, err
 	}
+	cacheResultBlob(jobID, kind, b, gen)
 	return b, nil
 }
 
@@ -35,19 +188,53 @@ func HasJobBlob(jobID, kind string) bool {
 	if dbConn == nil {
 		return false
 	}
+	if blobKnownPresent(jobID, kind) {
+		return true
+	}
+	gen := resultCacheGen()
 	var n int
 	err := dbConn.QueryRow(`SELECT COUNT(1) FROM job_blobs WHERE job_id = ? AND kind = ?`, jobID, kind).Scan(&n)
 	if err != nil {
 		return false
 	}
+	if n > 0 {
+		markBlobPresent(jobID, kind, gen)
+	}
 	return n > 0
 }
 
+// JobIDsWithBlob returns the ids of all jobs that have a blob of kind, read in
+// one query instead of one HasJobBlob lookup per job.
+func JobIDsWithBlob(kind string) (map[string]struct{}, error) {
+	if dbConn == nil {
+		return nil, fmt.Errorf("db is not initialized")
+	}
+	gen := resultCacheGen()
+	rows, err := dbConn.Query(`SELECT job_id FROM job_blobs WHERE kind = ?`, kind)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+
+	out := map[string]struct{}{}
+	for rows.Next() {
+		var jobID string
+		if err := rows.Scan(&jobID); err != nil {
+			return nil, err
+		}
+		out[jobID] = struct{}{}
+		markBlobPresent(jobID, kind, gen)
+	}
+	return out, rows.Err()
+}
+
 func DeleteJobBlobs(jobID string) {
 	if dbConn == nil {
 		return
 	}
 	_, _ = dbConn.Exec(`DELETE FROM job_blobs WHERE job_id = ?`, jobID)
+	dropCachedResultBlobs(jobID, BlobKindTranscript, BlobKindRefined)
+	forgetBlobs(jobID)
 }
 
 func DeleteJobBlob(jobID, kind string) {
@@ -55,6 +242,8 @@ func DeleteJobBlob(jobID, kind string) {
 		return
 	}
 	_, _ = dbConn.Exec(`DELETE FROM job_blobs WHERE job_id = ? AND kind = ?`, jobID, kind)
+	dropCachedResultBlobs(jobID, kind)
+	forgetBlobs(jobID, kind)
 }
 
 func ListJobBlobUsageByOwner(ownerID string) ([]JobBlobUsage, error) {
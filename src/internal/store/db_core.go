@@ -44,14 +44,12 @@ func Init(projectRoot string) error {
 	}
 
 	dbPath := filepath.Join(runDir, "whisper.db")
-	db, err := sql.Open("sqlite", dbPath)
+	// Pragmas in the DSN run on every pooled connection, not just the first.
+	// WAL lets status polls read while the job saver or a blob write commits.
+	db, err := sql.Open("sqlite", dbPath+"?_pragma=foreign_keys(1)&_pragma=journal_mode(WAL)&_pragma=synchronous(NORMAL)&_pragma=busy_timeout(5000)")
 	if err != nil {
 		return err
 	}
-	if _, err := db.Exec(`PRAGMA foreign_keys = ON;`); err != nil {
-		_ = db.Close()
-		return err
-	}
 
 	for _, s := range schemaStatements() {
 		if _, err := db.Exec(s); err != nil {
@@ -516,7 +514,7 @@ func encodeTagsJSON(tags []string) string {
 
 func decodeTagsJSON(value string) []string {
 	value = strings.TrimSpace(value)
-	if value == "" {
+	if value == "" || value == "[]" {
 		return nil
 	}
 	var tags []string
@@ -12,6 +12,10 @@ func LoadJobs() (map[string]*model.Job, error) {
 		return map[string]*model.Job{}, fmt.Errorf("db is not initialized")
 	}
 
+	blobs, err := loadJobBlobStates()
+	if err != nil {
+		return nil, err
+	}
 	rows, err := dbConn.Query(`
 		SELECT
 			id, status_code, filename, file_type, uploaded_ts, media_duration_seconds,
@@ -71,24 +75,74 @@ func LoadJobs() (map[string]*model.Job, error) {
 			v := int(mediaDurationSeconds.Int64)
 			job.MediaDurationSeconds = &v
 		}
-		if preview, previewErr := LoadJobBlob(id, BlobKindPreview); previewErr == nil {
-			job.PreviewText = string(preview)
+		if state, ok := blobs[id]; ok {
+			job.PreviewText = state.preview
+			if state.hasTranscript {
+				job.Result = "db://transcript"
+			}
+			if state.hasRefined {
+				job.ResultRefined = "db://refined"
+			}
+		}
+		out[id] = job.Clone()
+	}
+	return out, rows.Err()
+}
+
+type jobBlobState struct {
+	preview       string
+	hasTranscript bool
+	hasRefined    bool
+}
+
+// loadJobBlobStates reads preview text and result presence for every job in
+// one query instead of three lookups per job.
+func loadJobBlobStates() (map[string]*jobBlobState, error) {
+	rows, err := dbConn.Query(`
+		SELECT job_id, kind, CASE WHEN kind = ? THEN data END
+		FROM job_blobs
+		WHERE kind IN (?, ?, ?)
+	`, BlobKindPreview, BlobKindPreview, BlobKindTranscript, BlobKindRefined)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+
+	out := make(map[string]*jobBlobState)
+	for rows.Next() {
+		var (
+			jobID string
+			kind  string
+			data  []byte
+		)
+		if err := rows.Scan(&jobID, &kind, &data); err != nil {
+			return nil, err
 		}
-		if HasJobBlob(id, BlobKindTranscript) {
-			job.Result = "db://transcript"
+		state := out[jobID]
+		if state == nil {
+			state = &jobBlobState{}
+			out[jobID] = state
 		}
-		if HasJobBlob(id, BlobKindRefined) {
-			job.ResultRefined = "db://refined"
+		switch kind {
+		case BlobKindPreview:
+			state.preview = string(data)
+		case BlobKindTranscript:
+			state.hasTranscript = true
+		case BlobKindRefined:
+			state.hasRefined = true
 		}
-		out[id] = job.Clone()
 	}
 	return out, rows.Err()
 }
 
-func SaveJobs(snapshot map[string]*model.Job) (err error) {
+// UpsertJobs writes only the given jobs; rows for other jobs are untouched.
+func UpsertJobs(jobs map[string]*model.Job) (err error) {
 	if dbConn == nil {
 		return fmt.Errorf("db is not initialized")
 	}
+	if len(jobs) == 0 {
+		return nil
+	}
 
 	tx, err := dbConn.Begin()
 	if err != nil {
@@ -100,48 +154,39 @@ func SaveJobs(snapshot map[string]*model.Job) (err error) {
 		}
 	}()
 
-	existing := map[string]struct{}{}
-	rows, err := tx.Query(`SELECT id FROM jobs`)
+	stmt, err := tx.Prepare(`
+		INSERT INTO jobs(
+			id, status_code, filename, file_type, uploaded_ts, media_duration_seconds,
+			description, refine_enabled, owner_id, tags_json, folder_id, is_trashed,
+			deleted_ts, started_ts, completed_ts, progress_percent
+		) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+		ON CONFLICT(id) DO UPDATE SET
+			status_code=excluded.status_code,
+			filename=excluded.filename,
+			file_type=excluded.file_type,
+			uploaded_ts=excluded.uploaded_ts,
+			media_duration_seconds=excluded.media_duration_seconds,
+			description=excluded.description,
+			refine_enabled=excluded.refine_enabled,
+			owner_id=excluded.owner_id,
+			tags_json=excluded.tags_json,
+			folder_id=excluded.folder_id,
+			is_trashed=excluded.is_trashed,
+			deleted_ts=excluded.deleted_ts,
+			started_ts=excluded.started_ts,
+			completed_ts=excluded.completed_ts,
+			progress_percent=excluded.progress_percent
+	`)
 	if err != nil {
 		return err
 	}
-	for rows.Next() {
-		var id string
-		if scanErr := rows.Scan(&id); scanErr != nil {
-			_ = rows.Close()
-			return scanErr
-		}
-		existing[id] = struct{}{}
-	}
-	if err := rows.Close(); err != nil {
-		return err
-	}
+	defer stmt.Close()
 
-	seen := map[string]struct{}{}
-	for id, job := range snapshot {
-		if _, execErr := tx.Exec(`
-			INSERT INTO jobs(
-				id, status_code, filename, file_type, uploaded_ts, media_duration_seconds,
-				description, refine_enabled, owner_id, tags_json, folder_id, is_trashed,
-				deleted_ts, started_ts, completed_ts, progress_percent
-			) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-			ON CONFLICT(id) DO UPDATE SET
-				status_code=excluded.status_code,
-				filename=excluded.filename,
-				file_type=excluded.file_type,
-				uploaded_ts=excluded.uploaded_ts,
-				media_duration_seconds=excluded.media_duration_seconds,
-				description=excluded.description,
-				refine_enabled=excluded.refine_enabled,
-				owner_id=excluded.owner_id,
-				tags_json=excluded.tags_json,
-				folder_id=excluded.folder_id,
-				is_trashed=excluded.is_trashed,
-				deleted_ts=excluded.deleted_ts,
-				started_ts=excluded.started_ts,
-				completed_ts=excluded.completed_ts,
-				progress_percent=excluded.progress_percent
-		`,
+	for id, job := range jobs {
+		if job == nil {
+			continue
+		}
+		if _, err = stmt.Exec(
 			id,
 			job.StatusCode,
 			job.Filename,
@@ -158,21 +203,44 @@ func SaveJobs(snapshot map[string]*model.Job) (err error) {
 			job.StartedTS,
 			job.CompletedTS,
 			job.ProgressPercent,
-		); execErr != nil {
-			return execErr
+		); err != nil {
+			return err
 		}
-		seen[id] = struct{}{}
 	}
 
-	for id := range existing {
-		if _, ok := seen[id]; ok {
-			continue
+	err = tx.Commit()
+	return err
+}
+
+func DeleteJobs(ids []string) (err error) {
+	if dbConn == nil {
+		return fmt.Errorf("db is not initialized")
+	}
+	if len(ids) == 0 {
+		return nil
+	}
+
+	tx, err := dbConn.Begin()
+	if err != nil {
+		return err
+	}
+	defer func() {
+		if err != nil {
+			_ = tx.Rollback()
 		}
-		if _, execErr := tx.Exec(`DELETE FROM jobs WHERE id = ?`, id); execErr != nil {
-			return execErr
+	}()
+	for _, id := range ids {
+		if _, err = tx.Exec(`DELETE FROM jobs WHERE id = ?`, id); err != nil {
+			return err
 		}
 	}
-
-	err = tx.Commit()
-	return err
+	if err = tx.Commit(); err != nil {
+		return err
+	}
+	// Blob rows went with the jobs through ON DELETE CASCADE.
+	for _, id := range ids {
+		dropCachedResultBlobs(id, BlobKindTranscript, BlobKindRefined)
+		forgetBlobs(id)
+	}
+	return nil
 }
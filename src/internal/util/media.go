@@ -1,6 +1,7 @@
 package util
 
 import (
+	"encoding/binary"
 	"errors"
 	"fmt"
 	"io"
@@ -10,14 +11,31 @@ import (
 	"os/exec"
 	"path/filepath"
 	"regexp"
+	"runtime"
 	"sort"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 )
 
 var ErrUploadTooLarge = errors.New("upload too large")
 
+// ffmpegThreads caps per-conversion threads so an upload or WAV conversion
+// does not compete with whisper-cli for every core.
+const ffmpegThreads = "2"
+
+// ffmpegSlots is the single limiter for every ffmpeg run (upload AAC encodes
+// and worker WAV conversions). NumCPU/2 slots of ffmpegThreads threads each
+// keep ffmpeg at about one thread per core; a burst of uploads queues here
+// instead of oversubscribing the CPU.
+var ffmpegSlots = make(chan struct{}, max(1, runtime.NumCPU()/2))
+
+func acquireFFmpeg() func() {
+	ffmpegSlots <- struct{}{}
+	return func() { <-ffmpegSlots }
+}
+
 const wavTranscriptionFilter = "highpass=f=80,lowpass=f=7000,dynaudnorm=f=150:g=15:p=0.95:m=10,alimiter=limit=0.95"
 
 func DetectFileType(name string) string {
@@ -50,6 +68,19 @@ func SecureFilename(name string, secureRe *regexp.Regexp) string {
 	return base
 }
 
+// uploadBufPool reuses the chunk buffers of throttled uploads so each upload
+// does not allocate a fresh multi-megabyte slice for the GC to reclaim.
+var uploadBufPool sync.Pool
+
+func getUploadBuf(size int) *[]byte {
+	if bp, ok := uploadBufPool.Get().(*[]byte); ok && cap(*bp) >= size {
+		*bp = (*bp)[:size]
+		return bp
+	}
+	b := make([]byte, size)
+	return &b
+}
+
 func SaveUploadWithLimit(h *multipart.FileHeader, dst string, maxBytes int64, chunkSize int, bytesPerSec int64) (int64, error) {
 	src, err := h.Open()
 	if err != nil {
@@ -57,13 +88,39 @@ func SaveUploadWithLimit(h *multipart.FileHeader, dst string, maxBytes int64, ch
 	}
 	defer src.Close()
 
+	if h.Size > maxBytes {
+		return h.Size, ErrUploadTooLarge
+	}
+	if f, ok := src.(*os.File); ok && bytesPerSec <= 0 {
+		// Large parts are already spilled to a temp file by the multipart
+		// reader; moving it avoids writing the whole upload a second time.
+		if err := os.Rename(f.Name(), dst); err == nil {
+			return h.Size, nil
+		}
+	}
+
 	out, err := os.Create(dst)
 	if err != nil {
 		return 0, err
 	}
 	defer out.Close()
 
-	buf := make([]byte, chunkSize)
+	if bytesPerSec <= 0 {
+		// Unthrottled uploads let io.Copy hand disk-backed parts to the kernel
+		// (copy_file_range/sendfile) instead of bouncing through a user buffer.
+		written, err := io.Copy(out, io.LimitReader(src, maxBytes+1))
+		if err != nil {
+			return written, err
+		}
+		if written > maxBytes {
+			return written, ErrUploadTooLarge
+		}
+		return written, nil
+	}
+
+	bp := getUploadBuf(chunkSize)
+	defer uploadBufPool.Put(bp)
+	buf := *bp
 	var written int64
 	startedAt := time.Now()
 	for {
@@ -76,11 +133,9 @@ func SaveUploadWithLimit(h *multipart.FileHeader, dst string, maxBytes int64, ch
 			if _, err := out.Write(buf[:n]); err != nil {
 				return written, err
 			}
-			if bytesPerSec > 0 {
-				expectedElapsed := time.Duration(float64(written) / float64(bytesPerSec) * float64(time.Second))
-				if sleepFor := time.Until(startedAt.Add(expectedElapsed)); sleepFor > 0 {
-					time.Sleep(sleepFor)
-				}
+			expectedElapsed := time.Duration(float64(written) / float64(bytesPerSec) * float64(time.Second))
+			if sleepFor := time.Until(startedAt.Add(expectedElapsed)); sleepFor > 0 {
+				time.Sleep(sleepFor)
 			}
 		}
 		if readErr == io.EOF {
@@ -102,6 +157,7 @@ func ConvertToWav(src, dst string) error {
 		"-ar", "16000",
 		"-c:a", "pcm_s16le",
 		"-af", wavTranscriptionFilter,
+		"-threads", ffmpegThreads,
 		dst,
 	}
 	if out, err := runFFmpeg(filteredArgs...); err == nil {
@@ -114,6 +170,7 @@ func ConvertToWav(src, dst string) error {
 			"-ac", "1",
 			"-ar", "16000",
 			"-c:a", "pcm_s16le",
+			"-threads", ffmpegThreads,
 			dst,
 		}
 		if fallbackOut, fallbackErr := runFFmpeg(plainArgs...); fallbackErr == nil {
@@ -124,7 +181,9 @@ func ConvertToWav(src, dst string) error {
 	}
 }
 
-func ConvertToAac(src, dst string) error {
+// ConvertToAac also returns the input duration ffmpeg reports while opening
+// src (nil when it prints none), so callers can skip a separate ffprobe run.
+func ConvertToAac(src, dst string) (*int, error) {
 	cmd := exec.Command(
 		"ffmpeg",
 		"-y",
@@ -133,18 +192,41 @@ func ConvertToAac(src, dst string) error {
 		"-c:a", "aac",
 		"-b:a", "192k",
 		"-ar", "48000",
+		"-threads", ffmpegThreads,
 		dst,
 	)
+	release := acquireFFmpeg()
 	out, err := cmd.CombinedOutput()
+	release()
 	if err != nil {
-		return fmt.Errorf("ffmpeg failed: %w | output=%s", err, strings.TrimSpace(string(out)))
+		return nil, fmt.Errorf("ffmpeg failed: %w | output=%s", err, strings.TrimSpace(string(out)))
+	}
+	return ffmpegInputDuration(out), nil
+}
+
+var ffmpegDurationRe = regexp.MustCompile(`Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)`)
+
+func ffmpegInputDuration(out []byte) *int {
+	m := ffmpegDurationRe.FindSubmatch(out)
+	if len(m) != 4 {
+		return nil
+	}
+	h, _ := strconv.ParseFloat(string(m[1]), 64)
+	mm, _ := strconv.ParseFloat(string(m[2]), 64)
+	ss, _ := strconv.ParseFloat(string(m[3]), 64)
+	total := h*3600 + mm*60 + ss
+	if total <= 0 {
+		return nil
 	}
-	return nil
+	v := int(math.Round(total))
+	return &v
 }
 
 func runFFmpeg(args ...string) (string, error) {
 	cmd := exec.Command("ffmpeg", args...)
+	release := acquireFFmpeg()
 	out, err := cmd.CombinedOutput()
+	release()
 	if err != nil {
 		trimmed := strings.TrimSpace(string(out))
 		return trimmed, fmt.Errorf("%w | output=%s", err, trimmed)
@@ -153,6 +235,12 @@ func runFFmpeg(args ...string) (string, error) {
 }
 
 func GetMediaDuration(path string) *int {
+	if strings.EqualFold(filepath.Ext(path), ".wav") {
+		if sec, ok := wavDuration(path); ok {
+			v := int(math.Round(sec))
+			return &v
+		}
+	}
 	cmd := exec.Command("ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", path)
 	out, err := cmd.Output()
 	if err != nil {
@@ -170,6 +258,65 @@ func GetMediaDuration(path string) *int {
 	return &v
 }
 
+// wavDuration reads the duration from a RIFF/WAVE header in-process, so the
+// common wav case does not fork ffprobe. ok is false for anything unusual.
+func wavDuration(path string) (float64, bool) {
+	f, err := os.Open(path)
+	if err != nil {
+		return 0, false
+	}
+	defer f.Close()
+	st, err := f.Stat()
+	if err != nil {
+		return 0, false
+	}
+
+	var hdr [12]byte
+	if _, err := io.ReadFull(f, hdr[:]); err != nil {
+		return 0, false
+	}
+	if string(hdr[0:4]) != "RIFF" || string(hdr[8:12]) != "WAVE" {
+		return 0, false
+	}
+
+	var byteRate uint32
+	off := int64(12)
+	for {
+		var ch [8]byte
+		if _, err := f.ReadAt(ch[:], off); err != nil {
+			return 0, false
+		}
+		id := string(ch[0:4])
+		size := int64(binary.LittleEndian.Uint32(ch[4:8]))
+		body := off + 8
+		switch id {
+		case "fmt ":
+			var fmtBuf [16]byte
+			if size < 16 {
+				return 0, false
+			}
+			if _, err := f.ReadAt(fmtBuf[:], body); err != nil {
+				return 0, false
+			}
+			byteRate = binary.LittleEndian.Uint32(fmtBuf[8:12])
+		case "data":
+			if byteRate == 0 {
+				return 0, false
+			}
+			// Streamed writers that cannot seek back leave the size as a 0 or
+			// 0xFFFFFFFF placeholder; trust the file then.
+			if size == 0 || size == 0xFFFFFFFF || body+size > st.Size() {
+				size = st.Size() - body
+			}
+			if size <= 0 {
+				return 0, false
+			}
+			return float64(size) / float64(byteRate), true
+		}
+		off = body + size + size%2
+	}
+}
+
 func FormatSecondsPtr(sec *int) string {
 	if sec == nil {
 		return "-"
@@ -177,15 +324,32 @@ func FormatSecondsPtr(sec *int) string {
 	return FormatSeconds(*sec)
 }
 
+// FormatSeconds renders sec as mm:ss or h:mm:ss. It runs for every job on
+// each hydrate, so the common non-negative case avoids fmt.
 func FormatSeconds(sec int) string {
 	h := sec / 3600
 	r := sec % 3600
 	m := r / 60
 	s := r % 60
+	if sec < 0 {
+		return fmt.Sprintf("%02d:%02d", m, s)
+	}
+	b := make([]byte, 0, 16)
 	if h > 0 {
-		return fmt.Sprintf("%d:%02d:%02d", h, m, s)
+		b = strconv.AppendInt(b, int64(h), 10)
+		b = append(b, ':')
+	}
+	b = appendTwoDigits(b, m)
+	b = append(b, ':')
+	b = appendTwoDigits(b, s)
+	return string(b)
+}
+
+func appendTwoDigits(b []byte, v int) []byte {
+	if v < 10 {
+		b = append(b, '0')
 	}
-	return fmt.Sprintf("%02d:%02d", m, s)
+	return strconv.AppendInt(b, int64(v), 10)
 }
 
 func SortedExts(allowedExtensions map[string]struct{}) []string {
@@ -0,0 +1,108 @@
+package util
+
+import (
+	"encoding/binary"
+	"os"
+	"path/filepath"
+	"testing"
+)
+
+type wavChunk struct {
+	id   string
+	size uint32
+	body []byte
+}
+
+// buildWav lays out a RIFF/WAVE file from chunks; size is written as given so
+// placeholder values can be tested, and odd bodies get their pad byte.
+func buildWav(chunks ...wavChunk) []byte {
+	b := []byte("RIFF\x00\x00\x00\x00WAVE")
+	for _, c := range chunks {
+		b = append(b, c.id...)
+		b = binary.LittleEndian.AppendUint32(b, c.size)
+		b = append(b, c.body...)
+		if len(c.body)%2 == 1 {
+			b = append(b, 0)
+		}
+	}
+	binary.LittleEndian.PutUint32(b[4:8], uint32(len(b)-8))
+	return b
+}
+
+// fmtBody returns a PCM fmt chunk body for 16 kHz mono 16-bit (32000 B/s),
+// padded with zeros to n bytes for WAVE_FORMAT_EXTENSIBLE layouts.
+func fmtBody(n int) []byte {
+	body := make([]byte, n)
+	binary.LittleEndian.PutUint16(body[0:2], 1)
+	binary.LittleEndian.PutUint16(body[2:4], 1)
+	binary.LittleEndian.PutUint32(body[4:8], 16000)
+	binary.LittleEndian.PutUint32(body[8:12], 32000)
+	binary.LittleEndian.PutUint16(body[12:14], 2)
+	binary.LittleEndian.PutUint16(body[14:16], 16)
+	return body
+}
+
+func TestWavDuration(t *testing.T) {
+	canonical := buildWav(
+		wavChunk{id: "fmt ", size: 16, body: fmtBody(16)},
+		wavChunk{id: "data", size: 64000, body: make([]byte, 64000)},
+	)
+	tests := []struct {
+		name   string
+		data   []byte
+		want   float64
+		wantOK bool
+	}{
+		{name: "canonical", data: canonical, want: 2, wantOK: true},
+		{
+			name: "extensible fmt and odd LIST chunk",
+			data: buildWav(
+				wavChunk{id: "fmt ", size: 40, body: fmtBody(40)},
+				wavChunk{id: "LIST", size: 5, body: []byte("INFOx")},
+				wavChunk{id: "data", size: 32000, body: make([]byte, 32000)},
+			),
+			want:   1,
+			wantOK: true,
+		},
+		{
+			name: "zero size placeholder",
+			data: buildWav(
+				wavChunk{id: "fmt ", size: 16, body: fmtBody(16)},
+				wavChunk{id: "data", size: 0, body: make([]byte, 32000)},
+			),
+			want:   1,
+			wantOK: true,
+		},
+		{
+			name: "unknown size placeholder",
+			data: buildWav(
+				wavChunk{id: "fmt ", size: 16, body: fmtBody(16)},
+				wavChunk{id: "data", size: 0xFFFFFFFF, body: make([]byte, 16000)},
+			),
+			want:   0.5,
+			wantOK: true,
+		},
+		{
+			name: "zero size with no samples",
+			data: buildWav(
+				wavChunk{id: "fmt ", size: 16, body: fmtBody(16)},
+				wavChunk{id: "data", size: 0},
+			),
+		},
+		{name: "truncated fmt", data: canonical[:30]},
+		{name: "missing data chunk", data: canonical[:36]},
+		{name: "not riff", data: append([]byte("RIFX"), canonical[4:]...)},
+	}
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			path := filepath.Join(t.TempDir(), "in.wav")
+			if err := os.WriteFile(path, tc.data, 0o600); err != nil {
+				t.Fatalf("write wav: %v", err)
+			}
+			got, ok := wavDuration(path)
+			if ok != tc.wantOK || got != tc.want {
+				t.Fatalf("wavDuration = (%v, %v), want (%v, %v)", got, ok, tc.want, tc.wantOK)
+			}
+		})
+	}
+}
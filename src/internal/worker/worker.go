@@ -20,6 +20,15 @@ type Config struct {
 	SplitTaskQueues       bool
 	TmpFolder             string
 	ModelDir              string
+	ModelFile             string
+	Threads               int
+	FlashAttn             bool
+	Processors            int
+	BeamSize              int
+	BestOf                int
+	NoFallback            bool
+	TranscribeWorkers     int
+	RefineWorkers         int
 	WhisperCLI            string
 	JobTimeoutSec         int
 	ProgressRe            *regexp.Regexp
@@ -32,22 +41,22 @@ type Config struct {
 }
 
 type Deps struct {
-	GetJob                func(string) *model.Job
-	SetJobFields          func(string, map[string]any)
-	AppendJobPreviewLine  func(string, string)
-	ReplaceJobPreviewText func(string, string)
-	ConvertToWav          func(string, string) error
-	HasGeminiConfigured   func() bool
-	RefineTranscript      func(string, string) (string, error)
-	UniqueStrings         func([]string) []string
-	GetTagDescriptions    func(string, []string) (map[string]string, error)
-	Logf                  func(string, ...any)
-	Errf                  func(string, error, string, ...any)
-	IncInProgress         func()
-	DecInProgress         func()
-	SetQueueLength        func(float64)
-	IncJobsTotal          func(string)
-	ObserveJobDuration    func(float64)
+	GetJob               func(string) *model.Job
+	SetJobFields         func(string, map[string]any)
+	SetJobProgress       func(string, string, int)
+	AppendJobPreviewLine func(string, string)
+	ConvertToWav         func(string, string) error
+	HasGeminiConfigured  func() bool
+	RefineTranscript     func(string, string) (string, error)
+	UniqueStrings        func([]string) []string
+	GetTagDescriptions   func(string, []string) (map[string]string, error)
+	Logf                 func(string, ...any)
+	Errf                 func(string, error, string, ...any)
+	IncInProgress        func()
+	DecInProgress        func()
+	SetQueueLength       func(float64)
+	IncJobsTotal         func(string)
+	ObserveJobDuration   func(float64)
 }
 
 type taskType string
@@ -62,84 +71,183 @@ type task struct {
 	kind  taskType
 }
 
+// taskFIFO is an unbounded task queue. Enqueueing never blocks, so HTTP
+// handlers and startup requeue are not stalled behind a full buffer while
+// workers are busy with long whisper runs. A task that is already waiting in
+// the queue is not added again.
+type taskFIFO struct {
+	mu     sync.Mutex
+	cond   *sync.Cond
+	items  []task
+	queued map[task]struct{}
+	closed bool
+}
+
+func newTaskFIFO() *taskFIFO {
+	q := &taskFIFO{queued: map[task]struct{}{}}
+	q.cond = sync.NewCond(&q.mu)
+	return q
+}
+
+func (q *taskFIFO) push(t task) {
+	q.mu.Lock()
+	defer q.mu.Unlock()
+	if q.closed {
+		return
+	}
+	if _, ok := q.queued[t]; ok {
+		return
+	}
+	q.queued[t] = struct{}{}
+	q.items = append(q.items, t)
+	q.cond.Signal()
+}
+
+// pop blocks until a task is available. After close it drains the remaining
+// tasks and then reports ok=false.
+func (q *taskFIFO) pop() (task, bool) {
+	q.mu.Lock()
+	defer q.mu.Unlock()
+	for len(q.items) == 0 && !q.closed {
+		q.cond.Wait()
+	}
+	if len(q.items) == 0 {
+		return task{}, false
+	}
+	t := q.items[0]
+	q.items[0] = task{}
+	q.items = q.items[1:]
+	delete(q.queued, t)
+	return t, true
+}
+
+func (q *taskFIFO) size() int {
+	q.mu.Lock()
+	defer q.mu.Unlock()
+	return len(q.items)
+}
+
+func (q *taskFIFO) close() {
+	q.mu.Lock()
+	q.closed = true
+	q.mu.Unlock()
+	q.cond.Broadcast()
+}
+
 type Worker struct {
 	cfg             Config
 	deps            Deps
-	taskQueue       chan task
-	transcribeQueue chan task
-	refineQueue     chan task
+	taskQueue       *taskFIFO
+	transcribeQueue *taskFIFO
+	refineQueue     *taskFIFO
 	once            sync.Once
 	cancelMu        sync.Mutex
 	cancelMap       map[string]context.CancelFunc
+	busy            map[string]chan struct{}
 }
 
 func New(cfg Config, deps Deps) *Worker {
 	return &Worker{
 		cfg:             cfg,
 		deps:            deps,
-		taskQueue:       make(chan task, 256),
-		transcribeQueue: make(chan task, 256),
-		refineQueue:     make(chan task, 256),
+		taskQueue:       newTaskFIFO(),
+		transcribeQueue: newTaskFIFO(),
+		refineQueue:     newTaskFIFO(),
 		cancelMap:       map[string]context.CancelFunc{},
+		busy:            map[string]chan struct{}{},
 	}
 }
 
 func (w *Worker) Start() {
 	w.once.Do(func() {
+		workers := w.cfg.TranscribeWorkers
+		if workers < 1 {
+			workers = 1
+		}
 		if w.cfg.SplitTaskQueues {
-			w.deps.Logf("[WORKER] start mode=split")
-			go w.transcribeWorkerLoop()
-			go w.refineWorkerLoop()
+			refiners := w.cfg.RefineWorkers
+			if refiners < 1 {
+				refiners = 1
+			}
+			w.deps.Logf("[WORKER] start mode=split transcribe_workers=%d refine_workers=%d", workers, refiners)
+			for i := 0; i < workers; i++ {
+				go w.transcribeWorkerLoop()
+			}
+			// Refinement is network-bound, so several Gemini calls overlap
+			// while the transcribe workers keep whisper-cli busy.
+			for i := 0; i < refiners; i++ {
+				go w.refineWorkerLoop()
+			}
 		} else {
-			w.deps.Logf("[WORKER] start mode=single")
-			go w.workerLoop()
+			w.deps.Logf("[WORKER] start mode=single workers=%d", workers)
+			for i := 0; i < workers; i++ {
+				go w.workerLoop()
+			}
 		}
+		go w.warmModelCache()
 	})
 }
 
 func (w *Worker) Close() {
 	if w.cfg.SplitTaskQueues {
-		close(w.transcribeQueue)
-		close(w.refineQueue)
+		w.transcribeQueue.close()
+		w.refineQueue.close()
 		return
 	}
-	close(w.taskQueue)
+	w.taskQueue.close()
 }
 
 func (w *Worker) EnqueueTranscribe(jobID string) {
 	t := task{jobID: jobID, kind: taskTypeTranscribe}
 	if w.cfg.SplitTaskQueues {
-		w.transcribeQueue <- t
+		w.transcribeQueue.push(t)
 		w.setQueueLen()
 		return
 	}
-	w.taskQueue <- t
+	w.taskQueue.push(t)
 	w.setQueueLen()
 }
 
 func (w *Worker) EnqueueRefine(jobID string) {
 	t := task{jobID: jobID, kind: taskTypeRefine}
 	if w.cfg.SplitTaskQueues {
-		w.refineQueue <- t
+		w.refineQueue.push(t)
 		w.setQueueLen()
 		return
 	}
-	w.taskQueue <- t
+	w.taskQueue.push(t)
 	w.setQueueLen()
 }
 
 func (w *Worker) RequeuePending(jobs map[string]*model.Job) {
+	// Each blob kind is listed once, on first need, rather than queried per job.
+	indexes := map[string]map[string]struct{}{}
+	hasBlob := func(id, kind string) bool {
+		index, ok := indexes[kind]
+		if !ok {
+			var err error
+			if index, err = store.JobIDsWithBlob(kind); err != nil {
+				w.deps.Errf("worker.requeueBlobIndex", err, "kind=%s", kind)
+			}
+			indexes[kind] = index
+		}
+		if index == nil {
+			return store.HasJobBlob(id, kind)
+		}
+		_, ok = index[id]
+		return ok
+	}
 	for id, job := range jobs {
 		if job == nil || job.IsTrashed {
 			continue
 		}
 		switch job.Status {
 		case w.cfg.StatusPending, w.cfg.StatusRunning:
-			if store.HasJobBlob(id, store.BlobKindAudioAAC) {
+			if hasBlob(id, store.BlobKindAudioAAC) {
 				w.EnqueueTranscribe(id)
 			}
 		case w.cfg.StatusRefiningPending, w.cfg.StatusRefining:
-			if store.HasJobBlob(id, store.BlobKindTranscript) {
+			if hasBlob(id, store.BlobKindTranscript) {
 				w.EnqueueRefine(id)
 			}
 		}
@@ -165,19 +273,41 @@ func (w *Worker) setCancel(jobID string, cancel context.CancelFunc) {
 	w.cancelMap[jobID] = cancel
 }
 
+// lockJob serializes tasks for the same job across worker goroutines; they
+// share per-job temp paths and status transitions.
+func (w *Worker) lockJob(jobID string) func() {
+	for {
+		w.cancelMu.Lock()
+		wait, ok := w.busy[jobID]
+		if !ok {
+			done := make(chan struct{})
+			w.busy[jobID] = done
+			w.cancelMu.Unlock()
+			return func() {
+				w.cancelMu.Lock()
+				delete(w.busy, jobID)
+				w.cancelMu.Unlock()
+				close(done)
+			}
+		}
+		w.cancelMu.Unlock()
+		<-wait
+	}
+}
+
 func (w *Worker) setQueueLen() {
 	if w.deps.SetQueueLength == nil {
 		return
 	}
 	if w.cfg.SplitTaskQueues {
-		w.deps.SetQueueLength(float64(len(w.transcribeQueue) + len(w.refineQueue)))
+		w.deps.SetQueueLength(float64(w.transcribeQueue.size() + w.refineQueue.size()))
 		return
 	}
-	w.deps.SetQueueLength(float64(len(w.taskQueue)))
+	w.deps.SetQueueLength(float64(w.taskQueue.size()))
 }
 
 func (w *Worker) workerLoop() {
-	for t := range w.taskQueue {
+	for t, ok := w.taskQueue.pop(); ok; t, ok = w.taskQueue.pop() {
 		w.deps.Logf("[WORKER] dequeued mode=single job_id=%s kind=%s", t.jobID, t.kind)
 		w.deps.IncInProgress()
 		w.setQueueLen()
@@ -188,7 +318,7 @@ func (w *Worker) workerLoop() {
 }
 
 func (w *Worker) transcribeWorkerLoop() {
-	for t := range w.transcribeQueue {
+	for t, ok := w.transcribeQueue.pop(); ok; t, ok = w.transcribeQueue.pop() {
 		w.deps.Logf("[WORKER] dequeued mode=transcribe job_id=%s kind=%s", t.jobID, t.kind)
 		w.deps.IncInProgress()
 		w.setQueueLen()
@@ -199,7 +329,7 @@ func (w *Worker) transcribeWorkerLoop() {
 }
 
 func (w *Worker) refineWorkerLoop() {
-	for t := range w.refineQueue {
+	for t, ok := w.refineQueue.pop(); ok; t, ok = w.refineQueue.pop() {
 		w.deps.Logf("[WORKER] dequeued mode=refine job_id=%s kind=%s", t.jobID, t.kind)
 		w.deps.IncInProgress()
 		w.setQueueLen()
@@ -210,6 +340,8 @@ func (w *Worker) refineWorkerLoop() {
 }
 
 func (w *Worker) processTask(t task, splitMode bool) {
+	unlock := w.lockJob(t.jobID)
+	defer unlock()
 	job := w.deps.GetJob(t.jobID)
 	if job == nil || job.IsTrashed {
 		return
@@ -220,7 +352,8 @@ func (w *Worker) processTask(t task, splitMode bool) {
 		if job.Status != w.cfg.StatusPending && job.Status != w.cfg.StatusRunning {
 			return
 		}
-		if err := w.taskTranscribe(t.jobID); err != nil {
+		timelineText, err := w.taskTranscribe(t.jobID)
+		if err != nil {
 			w.deps.Errf("worker.transcribe", err, "job_id=%s", t.jobID)
 			return
 		}
@@ -233,27 +366,32 @@ func (w *Worker) processTask(t task, splitMode bool) {
 			w.deps.Logf("[WORKER] queued refine job_id=%s", t.jobID)
 			return
 		}
-		w.finalizeRefine(t.jobID)
+		w.finalizeRefine(t.jobID, timelineText)
 	case taskTypeRefine:
 		if job.Status != w.cfg.StatusRefiningPending && job.Status != w.cfg.StatusRefining {
 			return
 		}
-		w.finalizeRefine(t.jobID)
+		w.finalizeRefine(t.jobID, "")
 	}
 }
 
-func (w *Worker) finalizeRefine(jobID string) {
+// finalizeRefine refines timelineText, or the stored transcript when it is
+// empty (queued refines and requeues after a restart).
+func (w *Worker) finalizeRefine(jobID, timelineText string) {
 	job := w.deps.GetJob(jobID)
 	if job == nil || job.IsTrashed {
 		return
 	}
-	b, err := store.LoadJobBlob(jobID, store.BlobKindTranscript)
-	if err != nil {
-		w.deps.Errf("worker.loadTranscriptBlob", err, "job_id=%s", jobID)
-		w.deps.SetJobFields(jobID, map[string]any{"status": w.cfg.StatusFailed})
-		return
+	if timelineText == "" {
+		b, err := store.LoadJobBlob(jobID, store.BlobKindTranscript)
+		if err != nil {
+			w.deps.Errf("worker.loadTranscriptBlob", err, "job_id=%s", jobID)
+			w.deps.SetJobFields(jobID, map[string]any{"status": w.cfg.StatusFailed})
+			return
+		}
+		timelineText = string(b)
 	}
-	if err := w.taskRefining(jobID, string(b)); err != nil {
+	if err := w.taskRefining(jobID, timelineText); err != nil {
 		w.deps.SetJobFields(jobID, map[string]any{"status": w.cfg.StatusFailed})
 		w.deps.Errf("worker.refine", err, "job_id=%s", jobID)
 		return
@@ -265,7 +403,9 @@ func (w *Worker) finalizeRefine(jobID string) {
 	w.deps.Logf("[WORKER] completed job_id=%s result=db://transcript", jobID)
 }
 
-func (w *Worker) taskTranscribe(jobID string) error {
+// taskTranscribe returns the timeline transcript it saved, so an inline refine
+// can use it without loading the blob back.
+func (w *Worker) taskTranscribe(jobID string) (string, error) {
 	w.deps.Logf("[TRANSCRIBE] start job_id=%s input=db://wav", jobID)
 	started := time.Now()
 	w.deps.SetJobFields(jobID, map[string]any{
@@ -289,7 +429,7 @@ func (w *Worker) taskTranscribe(jobID string) error {
 		w.deps.Errf("transcribe.loadAudioBlob", err, "job_id=%s", jobID)
 		w.deps.SetJobFields(jobID, map[string]any{"status": w.cfg.StatusFailed})
 		w.deps.IncJobsTotal("failure")
-		return err
+		return "", err
 	}
 	aacPath := filepath.Join(w.cfg.TmpFolder, jobID+".m4a")
 	wavPath := filepath.Join(w.cfg.TmpFolder, jobID+".wav")
@@ -297,25 +437,17 @@ func (w *Worker) taskTranscribe(jobID string) error {
 		w.deps.Errf("transcribe.writeTempAac", err, "job_id=%s", jobID)
 		w.deps.SetJobFields(jobID, map[string]any{"status": w.cfg.StatusFailed})
 		w.deps.IncJobsTotal("failure")
-		return err
+		return "", err
 	}
 	if err := w.deps.ConvertToWav(aacPath, wavPath); err != nil {
 		_ = os.Remove(aacPath)
 		w.deps.Errf("transcribe.convertToWav", err, "job_id=%s", jobID)
 		w.deps.SetJobFields(jobID, map[string]any{"status": w.cfg.StatusFailed})
 		w.deps.IncJobsTotal("failure")
-		return err
+		return "", err
 	}
 	_ = os.Remove(aacPath)
-	wavBytes, err := os.ReadFile(wavPath)
-	if err != nil {
-		_ = os.Remove(wavPath)
-		w.deps.Errf("transcribe.readTempWav", err, "job_id=%s", jobID)
-		w.deps.SetJobFields(jobID, map[string]any{"status": w.cfg.StatusFailed})
-		w.deps.IncJobsTotal("failure")
-		return err
-	}
-	timelineText, transcriptJSON, err := w.runWhisperFromBlob(ctx, jobID, wavBytes, totalSec)
+	timelineText, transcriptJSON, err := w.runWhisper(ctx, jobID, wavPath, totalSec)
 	if err != nil {
 		statusLabel := "failure"
 		fields := map[string]any{"status": w.cfg.StatusFailed}
@@ -327,24 +459,24 @@ func (w *Worker) taskTranscribe(jobID string) error {
 		w.deps.IncJobsTotal(statusLabel)
 		w.deps.Errf("transcribe.runWhisper", err, "job_id=%s", jobID)
 		_ = os.Remove(wavPath)
-		return err
+		return "", err
 	}
 	if updated := w.deps.GetJob(jobID); updated == nil || updated.IsTrashed {
-		return nil
+		return "", nil
 	}
 
 	if err := store.SaveJobBlob(jobID, store.BlobKindTranscript, []byte(timelineText)); err != nil {
 		w.deps.SetJobFields(jobID, map[string]any{"status": w.cfg.StatusFailed})
 		w.deps.IncJobsTotal("failure")
 		w.deps.Errf("transcribe.saveTranscriptBlob", err, "job_id=%s", jobID)
-		return err
+		return "", err
 	}
 	if len(transcriptJSON) > 0 {
 		if err := store.SaveJobBlob(jobID, store.BlobKindTranscriptJSON, transcriptJSON); err != nil {
 			w.deps.SetJobFields(jobID, map[string]any{"status": w.cfg.StatusFailed})
 			w.deps.IncJobsTotal("failure")
 			w.deps.Errf("transcribe.saveTranscriptJSONBlob", err, "job_id=%s", jobID)
-			return err
+			return "", err
 		}
 	}
 	store.DeleteJobBlob(jobID, store.BlobKindPreview)
@@ -369,7 +501,7 @@ func (w *Worker) taskTranscribe(jobID string) error {
 	_ = os.Remove(wavPath)
 	w.deps.Logf("[TRANSCRIBE] cleaned input file job_id=%s", jobID)
 	w.deps.Logf("[TRANSCRIBE] done job_id=%s output=db://transcript status=%s duration_sec=%d", jobID, nextStatus, int(completed.Sub(started).Seconds()))
-	return nil
+	return timelineText, nil
 }
 
 func (w *Worker) taskRefining(jobID, timelineText string) error {
@@ -397,9 +529,8 @@ func (w *Worker) taskRefining(jobID, timelineText string) error {
 		w.deps.Errf("refine.saveRefinedBlob", err, "job_id=%s", jobID)
 		return err
 	}
-	if updated := w.deps.GetJob(jobID); updated == nil || updated.IsTrashed {
-		return nil
-	}
+	// Set the flag even if the job was trashed meanwhile, so a restored job
+	// still points at the refined blob that now exists.
 	w.deps.SetJobFields(jobID, map[string]any{"result_refined": "db://refined"})
 	w.deps.Logf("[REFINE] done job_id=%s output=db://refined", jobID)
 	return nil
@@ -0,0 +1,161 @@
+package worker
+
+import (
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"whisperserver/src/internal/model"
+	"whisperserver/src/internal/store"
+)
+
+func testConfig() Config {
+	return Config{
+		SplitTaskQueues:       true,
+		StatusPending:         model.JobStatusName(model.JobStatusPendingCode),
+		StatusRunning:         model.JobStatusName(model.JobStatusRunningCode),
+		StatusRefiningPending: model.JobStatusName(model.JobStatusRefiningPendingCode),
+		StatusRefining:        model.JobStatusName(model.JobStatusRefiningCode),
+		StatusCompleted:       model.JobStatusName(model.JobStatusCompletedCode),
+		StatusFailed:          model.JobStatusName(model.JobStatusFailedCode),
+	}
+}
+
+func testDeps(t *testing.T) Deps {
+	return Deps{
+		Logf: func(string, ...any) {},
+		Errf: func(scope string, err error, format string, args ...any) {
+			t.Errorf("unexpected error %s: %v", scope, err)
+		},
+	}
+}
+
+func TestTaskFIFOKeepsOrder(t *testing.T) {
+	q := newTaskFIFO()
+	want := []task{
+		{jobID: "a", kind: taskTypeTranscribe},
+		{jobID: "b", kind: taskTypeTranscribe},
+		{jobID: "a", kind: taskTypeRefine},
+		{jobID: "c", kind: taskTypeRefine},
+	}
+	for _, tk := range want {
+		q.push(tk)
+	}
+	q.close()
+	for i, w := range want {
+		got, ok := q.pop()
+		if !ok || got != w {
+			t.Fatalf("pop %d = (%+v, %v), want %+v", i, got, ok, w)
+		}
+	}
+	if _, ok := q.pop(); ok {
+		t.Fatal("pop after drain reported a task")
+	}
+}
+
+func TestTaskFIFOSkipsQueuedDuplicate(t *testing.T) {
+	q := newTaskFIFO()
+	tk := task{jobID: "a", kind: taskTypeTranscribe}
+	q.push(tk)
+	q.push(tk)
+	if n := q.size(); n != 1 {
+		t.Fatalf("size = %d, want 1", n)
+	}
+	if _, ok := q.pop(); !ok {
+		t.Fatal("pop reported no task")
+	}
+	// Once dequeued, the same task may be queued again.
+	q.push(tk)
+	if n := q.size(); n != 1 {
+		t.Fatalf("size after requeue = %d, want 1", n)
+	}
+}
+
+func TestLockJobSerializesSameJob(t *testing.T) {
+	w := New(testConfig(), testDeps(t))
+	var running, maxRunning int32
+	var wg sync.WaitGroup
+	for i := 0; i < 8; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			unlock := w.lockJob("job")
+			defer unlock()
+			n := atomic.AddInt32(&running, 1)
+			for {
+				m := atomic.LoadInt32(&maxRunning)
+				if n <= m || atomic.CompareAndSwapInt32(&maxRunning, m, n) {
+					break
+				}
+			}
+			time.Sleep(2 * time.Millisecond)
+			atomic.AddInt32(&running, -1)
+		}()
+	}
+	wg.Wait()
+	if maxRunning != 1 {
+		t.Fatalf("max concurrent holders = %d, want 1", maxRunning)
+	}
+}
+
+func TestLockJobAllowsOtherJobs(t *testing.T) {
+	w := New(testConfig(), testDeps(t))
+	unlockA := w.lockJob("a")
+	defer unlockA()
+	done := make(chan struct{})
+	go func() {
+		w.lockJob("b")()
+		close(done)
+	}()
+	select {
+	case <-done:
+	case <-time.After(time.Second):
+		t.Fatal("lock for job b waited on job a")
+	}
+}
+
+func TestRequeuePendingEnqueuesEachJobOnce(t *testing.T) {
+	if err := store.Init(t.TempDir()); err != nil {
+		t.Fatalf("store init: %v", err)
+	}
+	t.Cleanup(store.Close)
+
+	cfg := testConfig()
+	jobs := map[string]*model.Job{
+		"pending":  {Status: cfg.StatusPending, StatusCode: model.JobStatusPendingCode},
+		"refining": {Status: cfg.StatusRefining, StatusCode: model.JobStatusRefiningCode},
+		"no-audio": {Status: cfg.StatusPending, StatusCode: model.JobStatusPendingCode},
+	}
+	if err := store.UpsertJobs(jobs); err != nil {
+		t.Fatalf("upsert jobs: %v", err)
+	}
+	// "pending" also has a transcript from an earlier run; it must still be
+	// queued only for transcription.
+	for _, b := range []struct{ id, kind string }{
+		{"pending", store.BlobKindAudioAAC},
+		{"pending", store.BlobKindTranscript},
+		{"refining", store.BlobKindTranscript},
+	} {
+		if err := store.SaveJobBlob(b.id, b.kind, []byte("x")); err != nil {
+			t.Fatalf("save blob %s/%s: %v", b.id, b.kind, err)
+		}
+	}
+
+	w := New(cfg, testDeps(t))
+	w.RequeuePending(jobs)
+	w.RequeuePending(jobs)
+
+	if n := w.transcribeQueue.size(); n != 1 {
+		t.Fatalf("transcribe queue size = %d, want 1", n)
+	}
+	if n := w.refineQueue.size(); n != 1 {
+		t.Fatalf("refine queue size = %d, want 1", n)
+	}
+	if tk, _ := w.transcribeQueue.pop(); tk.jobID != "pending" {
+		t.Fatalf("transcribe queue holds %q, want pending", tk.jobID)
+	}
+	if tk, _ := w.refineQueue.pop(); tk.jobID != "refining" {
+		t.Fatalf("refine queue holds %q, want refining", tk.jobID)
+	}
+}
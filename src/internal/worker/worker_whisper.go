@@ -2,50 +2,97 @@ package worker
 
 import (
 	"bufio"
+	"bytes"
 	"context"
+	"encoding/binary"
 	"encoding/json"
 	"errors"
-	"fmt"
 	"io"
+	"math"
 	"os"
 	"os/exec"
 	"path/filepath"
+	"regexp"
 	"strconv"
 	"strings"
 	"sync"
+	"time"
 )
 
-func (w *Worker) runWhisperFromBlob(ctx context.Context, jobID string, wavBytes []byte, totalSec *int) (string, []byte, error) {
-	tmpDir, err := os.MkdirTemp("", "whisper-job-*")
-	if err != nil {
-		return "", nil, err
+const vadModelFile = "ggml-silero-v6.2.0.bin"
+
+// progressUpdateInterval caps how often a running job's progress fields are
+// updated; the final "전사 완료" update is always written.
+const progressUpdateInterval = 500 * time.Millisecond
+
+// whisperInputRe matches whisper-cli's "processing 'x.wav' (N samples, S sec)"
+// banner, which reports the exact decoded audio length.
+var whisperInputRe = regexp.MustCompile(`\(\d+ samples, (\d+(?:\.\d+)?) sec\)`)
+
+// warmModelCache reads the model files once so the page cache already holds
+// them when whisper-cli loads the weights for the first job.
+func (w *Worker) warmModelCache() {
+	for _, name := range []string{w.cfg.ModelFile, vadModelFile} {
+		path := filepath.Join(w.cfg.ModelDir, name)
+		f, err := os.Open(path)
+		if err != nil {
+			w.deps.Errf("whisper.warmModel", err, "path=%s", path)
+			continue
+		}
+		if name == w.cfg.ModelFile {
+			if weights := modelWeightType(f); weights == "f32" {
+				w.deps.Logf("[WHISPER] model uses f32 weights path=%s; an f16 or quantized model halves memory traffic", path)
+			} else if weights != "" {
+				w.deps.Logf("[WHISPER] model weights=%s path=%s", weights, path)
+			}
+		}
+		n, err := io.Copy(io.Discard, f)
+		f.Close()
+		if err != nil {
+			w.deps.Errf("whisper.warmModel", err, "path=%s", path)
+			continue
+		}
+		w.deps.Logf("[WHISPER] model cache warmed path=%s bytes=%d", path, n)
 	}
-	defer os.RemoveAll(tmpDir)
+}
 
-	wavPath := filepath.Join(tmpDir, jobID+".wav")
-	if err := os.WriteFile(wavPath, wavBytes, 0o644); err != nil {
-		return "", nil, err
+var ggmlFileTypes = map[int32]string{0: "f32", 1: "f16", 2: "q4_0", 3: "q4_1", 7: "q8_0", 8: "q5_0", 9: "q5_1"}
+
+// modelWeightType reads the ftype field of a ggml whisper model header
+// (magic followed by eleven int32 hyperparameters, ftype last).
+func modelWeightType(r io.ReaderAt) string {
+	var hdr [12]int32
+	if err := binary.Read(io.NewSectionReader(r, 0, 48), binary.LittleEndian, &hdr); err != nil {
+		return ""
+	}
+	if uint32(hdr[0]) != 0x67676d6c {
+		return ""
+	}
+	ftype := hdr[11] % 1000
+	if name, ok := ggmlFileTypes[ftype]; ok {
+		return name
 	}
-	return w.runWhisper(ctx, jobID, wavPath, totalSec)
+	return strconv.Itoa(int(ftype))
 }
 
 func (w *Worker) runWhisper(ctx context.Context, jobID, wavPath string, totalSec *int) (string, []byte, error) {
 	w.deps.Logf("[WHISPER] start job_id=%s wav=%s total_sec=%s", jobID, wavPath, formatTotalSec(totalSec))
-	outputPath := wavPath + ".txt"
 	outputJSONPath := wavPath + ".json"
-	modelBin := filepath.Join(w.cfg.ModelDir, "ggml-model.bin")
+	defer func() { _ = os.Remove(outputJSONPath) }()
+	modelBin := filepath.Join(w.cfg.ModelDir, w.cfg.ModelFile)
 	if _, err := os.Stat(modelBin); err != nil {
 		w.deps.Errf("whisper.modelPath", err, "job_id=%s model_dir=%s", jobID, w.cfg.ModelDir)
 		return "", nil, err
 	}
-	vadModel := filepath.Join(w.cfg.ModelDir, "ggml-silero-v6.2.0.bin")
+	vadModel := filepath.Join(w.cfg.ModelDir, vadModelFile)
 	if _, err := os.Stat(vadModel); err != nil {
 		w.deps.Errf("whisper.vadModelPath", err, "job_id=%s path=%s", jobID, vadModel)
 		return "", nil, err
 	}
 
-	cmd := exec.CommandContext(ctx, w.cfg.WhisperCLI,
+	args := []string{
 		"-m", modelBin,
+		"-t", strconv.Itoa(w.cfg.Threads),
 		"-l", "ko",
 		"--max-context", "0",
 		"--no-speech-thold", "0.01",
@@ -53,10 +100,25 @@ func (w *Worker) runWhisper(ctx context.Context, jobID, wavPath string, totalSec
 		"--vad",
 		"--vad-model", vadModel,
 		"--vad-threshold", "0.01",
-		"--output-txt",
 		"--output-json",
-		wavPath,
-	)
+	}
+	if w.cfg.FlashAttn {
+		args = append(args, "--flash-attn")
+	}
+	if w.cfg.Processors > 1 {
+		args = append(args, "-p", strconv.Itoa(w.cfg.Processors))
+	}
+	if w.cfg.BeamSize > 0 {
+		args = append(args, "--beam-size", strconv.Itoa(w.cfg.BeamSize))
+	}
+	if w.cfg.BestOf > 0 {
+		args = append(args, "--best-of", strconv.Itoa(w.cfg.BestOf))
+	}
+	if w.cfg.NoFallback {
+		args = append(args, "--no-fallback")
+	}
+	args = append(args, wavPath)
+	cmd := exec.CommandContext(ctx, w.cfg.WhisperCLI, args...)
 
 	stdout, err := cmd.StdoutPipe()
 	if err != nil {
@@ -73,7 +135,7 @@ func (w *Worker) runWhisper(ctx context.Context, jobID, wavPath string, totalSec
 		return "", nil, err
 	}
 
-	w.deps.SetJobFields(jobID, map[string]any{"phase": "전처리 중", "progress_percent": 0, "progress_label": "전처리 중..."})
+	w.deps.SetJobProgress(jobID, "전처리 중", 0)
 
 	lines := make(chan string, 256)
 	var wg sync.WaitGroup
@@ -86,54 +148,45 @@ func (w *Worker) runWhisper(ctx context.Context, jobID, wavPath string, totalSec
 	}()
 
 	lastPercent := -1
-	maxPercent := -1
 	lastProgressLog := -5
+	var lastProgressAt time.Time
 	sawTimeline := false
 	lastDiagnosticLine := ""
 
 	for line := range lines {
 		lastDiagnosticLine = line
 		if !strings.Contains(line, "-->") {
+			if totalSec == nil {
+				totalSec = w.durationFromBanner(jobID, line)
+			}
 			continue
 		}
-		m := w.cfg.ProgressRe.FindStringSubmatch(line)
-		if len(m) != 4 {
+		startSec, ok := w.timelineStartSec(line)
+		if !ok {
 			continue
 		}
-		h, _ := strconv.ParseFloat(m[1], 64)
-		mm, _ := strconv.ParseFloat(m[2], 64)
-		ss, _ := strconv.ParseFloat(m[3], 64)
-		startSec := h*3600 + mm*60 + ss
+		sawTimeline = true
+		// Progress never moves backwards, so lastPercent doubles as the
+		// running maximum.
 		percent := 0
 		if totalSec != nil && *totalSec > 0 {
-			percent = int((startSec / float64(*totalSec)) * 100)
-		}
-		if percent < maxPercent {
-			percent = maxPercent
+			percent = startSec * 100 / *totalSec
 		}
-		if previewBytes, readErr := os.ReadFile(outputPath); readErr == nil && len(previewBytes) > 0 {
-			w.deps.ReplaceJobPreviewText(jobID, string(previewBytes))
-		} else {
-			w.deps.AppendJobPreviewLine(jobID, line)
+		w.deps.AppendJobPreviewLine(jobID, line)
+		if percent <= lastPercent {
+			continue
 		}
-		if percent == lastPercent {
-			sawTimeline = true
+		now := time.Now()
+		if now.Sub(lastProgressAt) < progressUpdateInterval {
 			continue
 		}
-		w.deps.SetJobFields(jobID, map[string]any{
-			"phase":            "전사 중",
-			"progress_percent": percent,
-			"progress_label":   fmt.Sprintf("전사 중... %d%%", percent),
-		})
+		w.deps.SetJobProgress(jobID, "전사 중", percent)
 		lastPercent = percent
-		if percent > maxPercent {
-			maxPercent = percent
-		}
+		lastProgressAt = now
 		if percent >= lastProgressLog+5 || percent == 100 {
 			w.deps.Logf("[WHISPER] progress job_id=%s percent=%d", jobID, percent)
 			lastProgressLog = percent
 		}
-		sawTimeline = true
 	}
 
 	if err := cmd.Wait(); err != nil {
@@ -149,31 +202,77 @@ func (w *Worker) runWhisper(ctx context.Context, jobID, wavPath string, totalSec
 		return "", nil, err
 	}
 	if sawTimeline {
-		w.deps.SetJobFields(jobID, map[string]any{"phase": "전사 완료", "progress_percent": 100, "progress_label": "전사 완료"})
+		w.deps.SetJobProgress(jobID, "전사 완료", 100)
 	}
 
-	b, err := os.ReadFile(outputPath)
+	// The JSON output is the only file read back; both the timeline text and
+	// the slim segment JSON are built from one parse of it.
+	segments, err := loadTranscriptSegments(outputJSONPath)
 	if err != nil {
-		w.deps.Errf("whisper.readOutput", err, "job_id=%s path=%s", jobID, outputPath)
-		return "", nil, err
-	}
-	timelineText, err := buildTimelineTranscriptText(outputJSONPath)
-	if err != nil {
-		w.deps.Errf("whisper.buildTimelineTranscript", err, "job_id=%s path=%s", jobID, outputJSONPath)
+		w.deps.Errf("whisper.readOutputJSON", err, "job_id=%s path=%s", jobID, outputJSONPath)
 		return "", nil, err
 	}
-	slimJSON, err := buildSlimTranscriptJSON(outputJSONPath)
+	timelineText := buildTimelineTranscriptText(segments)
+	slimJSON, err := buildSlimTranscriptJSON(segments)
 	if err != nil {
-		w.deps.Errf("whisper.readOutputJSON", err, "job_id=%s path=%s", jobID, outputJSONPath)
+		w.deps.Errf("whisper.buildSlimTranscriptJSON", err, "job_id=%s", jobID)
 		return "", nil, err
 	}
-	w.deps.ReplaceJobPreviewText(jobID, string(b))
-	_ = os.Remove(outputPath)
-	_ = os.Remove(outputJSONPath)
 	w.deps.Logf("[WHISPER] done job_id=%s", jobID)
 	return timelineText, slimJSON, nil
 }
 
+// durationFromBanner fills in the media duration from whisper-cli output when
+// the upload-time probe could not determine it.
+func (w *Worker) durationFromBanner(jobID, line string) *int {
+	if !strings.Contains(line, " samples, ") {
+		return nil
+	}
+	m := whisperInputRe.FindStringSubmatch(line)
+	if len(m) != 2 {
+		return nil
+	}
+	sec, err := strconv.ParseFloat(m[1], 64)
+	if err != nil || sec <= 0 {
+		return nil
+	}
+	v := int(math.Round(sec))
+	w.deps.SetJobFields(jobID, map[string]any{"media_duration_seconds": v})
+	w.deps.Logf("[WHISPER] duration job_id=%s total_sec=%d source=whisper", jobID, v)
+	return &v
+}
+
+// timelineStartSec returns the whole-second start time of a
+// "[hh:mm:ss.mmm --> ...]" line; progress is an integer percent, so the
+// fraction is dropped. whisper-cli always prints that fixed layout, so it is
+// parsed directly and the progress regex only handles anything else.
+func (w *Worker) timelineStartSec(line string) (int, bool) {
+	if len(line) >= 10 && line[0] == '[' && line[3] == ':' && line[6] == ':' {
+		if sec, ok := hmsSeconds(line[1:3], line[4:6], line[7:9]); ok {
+			return sec, true
+		}
+	}
+	m := w.cfg.ProgressRe.FindStringSubmatch(line)
+	if len(m) != 4 {
+		return 0, false
+	}
+	return hmsSeconds(m[1], m[2], m[3][:2])
+}
+
+func hmsSeconds(hh, mm, ss string) (int, bool) {
+	h, okH := twoDigits(hh)
+	m, okM := twoDigits(mm)
+	s, okS := twoDigits(ss)
+	return h*3600 + m*60 + s, okH && okM && okS
+}
+
+func twoDigits(s string) (int, bool) {
+	if s[0] < '0' || s[0] > '9' || s[1] < '0' || s[1] > '9' {
+		return 0, false
+	}
+	return int(s[0]-'0')*10 + int(s[1]-'0'), true
+}
+
 func formatTotalSec(totalSec *int) string {
 	if totalSec == nil {
 		return "unknown"
@@ -184,20 +283,23 @@ func formatTotalSec(totalSec *int) string {
 func scanPipe(wg *sync.WaitGroup, r io.Reader, out chan<- string) {
 	defer wg.Done()
 	sc := bufio.NewScanner(r)
+	sc.Buffer(make([]byte, 64*1024), 1024*1024)
 	sc.Split(splitOnCRLF)
 	for sc.Scan() {
-		line := strings.TrimSpace(sc.Text())
-		if line != "" {
-			out <- line
+		// Trim on the raw bytes so blank/padding-only output never allocates.
+		if line := bytes.TrimSpace(sc.Bytes()); len(line) > 0 {
+			out <- string(line)
 		}
 	}
+	// Keep draining after a scan error so whisper-cli never blocks on a full pipe.
+	if sc.Err() != nil {
+		_, _ = io.Copy(io.Discard, r)
+	}
 }
 
 func splitOnCRLF(data []byte, atEOF bool) (advance int, token []byte, err error) {
-	for i, b := range data {
-		if b == '\n' || b == '\r' {
-			return i + 1, data[:i], nil
-		}
+	if i := bytes.IndexAny(data, "\r\n"); i >= 0 {
+		return i + 1, data[:i], nil
 	}
 	if atEOF && len(data) > 0 {
 		return len(data), data, nil
@@ -205,18 +307,20 @@ func splitOnCRLF(data []byte, atEOF bool) (advance int, token []byte, err error)
 	return 0, nil, nil
 }
 
+type whisperSegment struct {
+	Timestamps struct {
+		From string `json:"from"`
+		To   string `json:"to"`
+	} `json:"timestamps"`
+	Offsets struct {
+		From int `json:"from"`
+		To   int `json:"to"`
+	} `json:"offsets"`
+	Text string `json:"text"`
+}
+
 type whisperJSONOutput struct {
-	Transcription []struct {
-		Timestamps struct {
-			From string `json:"from"`
-			To   string `json:"to"`
-		} `json:"timestamps"`
-		Offsets struct {
-			From int `json:"from"`
-			To   int `json:"to"`
-		} `json:"offsets"`
-		Text string `json:"text"`
-	} `json:"transcription"`
+	Transcription []whisperSegment `json:"transcription"`
 }
 
 type slimTranscriptJSON struct {
@@ -229,11 +333,7 @@ type slimTranscriptSegment struct {
 	Text string `json:"text"`
 }
 
-func buildSlimTranscriptJSON(path string) ([]byte, error) {
-	segments, err := loadTranscriptSegments(path)
-	if err != nil {
-		return nil, err
-	}
+func buildSlimTranscriptJSON(segments []whisperSegment) ([]byte, error) {
 	out := slimTranscriptJSON{
 		Segments: make([]slimTranscriptSegment, 0, len(segments)),
 	}
@@ -247,33 +347,29 @@ func buildSlimTranscriptJSON(path string) ([]byte, error) {
 	return json.Marshal(out)
 }
 
-func buildTimelineTranscriptText(path string) (string, error) {
-	segments, err := loadTranscriptSegments(path)
-	if err != nil {
-		return "", err
-	}
-	lines := make([]string, 0, len(segments))
+func buildTimelineTranscriptText(segments []whisperSegment) string {
+	var sb strings.Builder
 	for _, item := range segments {
 		text := strings.TrimSpace(item.Text)
 		if text == "" {
 			continue
 		}
-		lines = append(lines, fmt.Sprintf(`%s ~ %s "%s"`, item.Timestamps.From, item.Timestamps.To, text))
+		if sb.Len() == 0 {
+			sb.Grow(len(segments) * (len(item.Timestamps.From) + len(item.Timestamps.To) + len(text) + 8))
+		} else {
+			sb.WriteByte('\n')
+		}
+		sb.WriteString(item.Timestamps.From)
+		sb.WriteString(" ~ ")
+		sb.WriteString(item.Timestamps.To)
+		sb.WriteString(` "`)
+		sb.WriteString(text)
+		sb.WriteByte('"')
 	}
-	return strings.Join(lines, "\n"), nil
+	return sb.String()
 }
 
-func loadTranscriptSegments(path string) ([]struct {
-	Timestamps struct {
-		From string `json:"from"`
-		To   string `json:"to"`
-	} `json:"timestamps"`
-	Offsets struct {
-		From int `json:"from"`
-		To   int `json:"to"`
-	} `json:"offsets"`
-	Text string `json:"text"`
-}, error) {
+func loadTranscriptSegments(path string) ([]whisperSegment, error) {
 	raw, err := os.ReadFile(path)
 	if err != nil {
 		return nil, err